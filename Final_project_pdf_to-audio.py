@@ -3,7 +3,532 @@ import pyttsx3     # pip install pyttsx3
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import threading
+import queue
+import os
 import re
+import shutil
+import hashlib
+import json
+import wave
+import zlib
+import argparse
+import time
+from functools import lru_cache
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Pages per job sent to a worker process - small enough that the first
+# pages show up quickly, big enough that each job is worth the overhead
+PAGES_PER_JOB = 8
+
+
+def count_pages(pdf_path):
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def extract_page_range(pdf_path, first, last):
+    """Extract text from pages first..last-1 (0-based). Runs in a worker process."""
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for index in range(first, last):
+            page = pdf.pages[index]
+            results.append((index + 1, page.extract_text() or ""))
+            page.close()  # free the parsed page objects
+    return results
+
+
+def iter_pdf_pages(pdf_path, workers=None, cancel_event=None, total=None):
+    """Yield (page_number, text) in page order while a process pool extracts them.
+
+    Page ranges are spread over `workers` processes (default: CPU count).
+    A page is yielded as soon as it and every page before it are done.
+    Short documents are read directly, a pool would only slow them down.
+    """
+    if total is None:
+        total = count_pages(pdf_path)
+    if total <= PAGES_PER_JOB or workers == 1:
+        yield from extract_page_range(pdf_path, 0, total)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    pending = {}
+    next_page = 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(extract_page_range, pdf_path, first, min(first + PAGES_PER_JOB, total))
+                   for first in range(0, total, PAGES_PER_JOB)]
+        try:
+            for future in as_completed(futures):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                for page_num, text in future.result():
+                    pending[page_num] = text
+                while next_page in pending:
+                    yield next_page, pending.pop(next_page)
+                    next_page += 1
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+# Longest piece of text sent to the TTS engine in one go
+CHUNK_CHARS = 1000
+
+# Cache of extracted text and rendered audio (AUDIOBOOK_CACHE_MB=0 turns it off)
+CACHE_DIR = os.environ.get('AUDIOBOOK_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'pdf_audiobook'))
+CACHE_MB = int(os.environ.get('AUDIOBOOK_CACHE_MB', 2048))
+# Files used this recently are never evicted, another conversion may be about to join them
+EVICT_GRACE_SECONDS = 600
+
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+# The number may already be spelled out by clean_text ("Chapter twenty-one")
+NUMBER_WORD = (r'(?:zero|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen'
+               r'|fifteen|sixteen|seventeen|eighteen|nineteen|twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety)')
+# A chapter heading only counts at the top of a page, right after the "Page N."
+# heading iter_clean_pages adds, so contents entries and "see Chapter 2" in a
+# sentence do not start a new chapter. Group 1 is the heading, e.g. "Chapter 2".
+CHAPTER_START = re.compile(
+    rf'\bPage \d+\. (Chapter\s+(?:\d+|[IVXLC]+|{NUMBER_WORD}(?:-{NUMBER_WORD})?(?: hundred(?: {NUMBER_WORD})?)?))\b'
+)
+
+# One TTS engine per worker process, created on first use
+_worker_engine = None
+
+
+# Changes whenever clean_text gives different output, so old cached text is not reused
+TEXT_VERSION = 3
+
+ABBREVIATIONS = {
+    'Dr.': 'Doctor', 'Mr.': 'Mister', 'Mrs.': 'Missus', 'Ms.': 'Miss', 'St.': 'Saint',
+    'Prof.': 'Professor', 'Fig.': 'Figure', 'No.': 'Number', 'vs.': 'versus',
+    'etc.': 'et cetera', 'e.g.': 'for example', 'i.e.': 'that is',
+    '%': ' percent', '&': ' and ',
+}
+
+# Abbreviations, symbols and numbers are expanded in one pass. The
+# lookahead lets the regex skip over ordinary lowercase text quickly.
+# Numbers must stand alone: "1st", "1990s", "A4", "mp3" and "2.0.1" are left as they are.
+EXPANSIONS = re.compile(
+    r'(?=[DMSPFN%&0-9])(?:\b(?:Dr|Mr|Mrs|Ms|St|Prof|Fig|No)\.|[%&]|\b(?<!\d\.)(\d{1,3}(?:,\d{3})+|\d+)(\.\d+)?(?!\w|\.\d))'
+)
+# Lowercase abbreviations, only searched for when the page has one. No \b
+# here, it makes the scan much slower; _expand_lower checks the boundary.
+LOWER_ABBREVIATIONS = re.compile(r'(?:vs|etc|e\.g|i\.e)\.')
+
+# Characters that cause TTS issues
+DROP_CHARS = re.compile(r'[^\w\s.,!?;:()\-]+')
+# The same set for pure ASCII text, used with bytes.translate
+DROP_ASCII = bytes(c for c in range(128) if DROP_CHARS.match(chr(c)))
+
+ONES = ('zero one two three four five six seven eight nine ten eleven twelve thirteen '
+        'fourteen fifteen sixteen seventeen eighteen nineteen').split()
+TENS = 'twenty thirty forty fifty sixty seventy eighty ninety'.split()
+SCALES = ((10 ** 12, 'trillion'), (10 ** 9, 'billion'), (10 ** 6, 'million'), (1000, 'thousand'))
+
+
+def number_to_words(n):
+    """Spell out a whole number, e.g. 1234 -> "one thousand two hundred thirty-four" """
+    if n < 20:
+        return ONES[n]
+    if n < 100:
+        tens, ones = divmod(n, 10)
+        return TENS[tens - 2] + (f"-{ONES[ones]}" if ones else "")
+    if n < 1000:
+        hundreds, rest = divmod(n, 100)
+        return f"{ONES[hundreds]} hundred" + (f" {number_to_words(rest)}" if rest else "")
+    for value, name in SCALES:
+        if n >= value:
+            high, rest = divmod(n, value)
+            return f"{number_to_words(high)} {name}" + (f" {number_to_words(rest)}" if rest else "")
+
+
+@lru_cache(maxsize=4096)
+def expand_token(token):
+    """Spoken form of an abbreviation, symbol or number like "1,234.5" """
+    if token in ABBREVIATIONS:
+        return ABBREVIATIONS[token]
+    whole, _, fraction = token.partition('.')
+    digits = whole.replace(',', '')
+    if len(digits) > 15:
+        return token  # too long to be worth spelling out
+    words = number_to_words(int(digits))
+    if fraction:
+        words += " point " + " ".join(ONES[int(d)] for d in fraction)
+    return words
+
+
+def _expand(match):
+    return expand_token(match.group(0))
+
+
+def _expand_lower(match):
+    start = match.start()
+    if start and match.string[start - 1].isalnum():
+        return match.group(0)  # part of a longer word
+    return ABBREVIATIONS[match.group(0)]
+
+
+def clean_text(text, expand=True):
+    """Normalize text for TTS.
+
+    Joins words hyphenated over a line break, spells out abbreviations,
+    numbers and symbols (unless expand is False), removes characters
+    that cause TTS issues and collapses whitespace. Meant to be run on
+    one page at a time.
+    """
+    if '-\n' in text:
+        text = text.replace('-\n', '')
+    if expand:
+        if 'vs.' in text or 'etc.' in text or 'e.g.' in text or 'i.e.' in text:
+            text = LOWER_ABBREVIATIONS.sub(_expand_lower, text)
+        text = EXPANSIONS.sub(_expand, text)
+    if text.isascii():
+        text = text.encode('ascii').translate(None, DROP_ASCII).decode('ascii')
+    else:
+        text = DROP_CHARS.sub('', text)
+    # split/join collapses all whitespace without another regex pass
+    return ' '.join(text.split())
+
+
+def split_into_chunks(text, max_chars=CHUNK_CHARS):
+    """Split text at sentence ends into chunks of at most max_chars.
+
+    Besides the size limit, a chunk also ends after any sentence whose
+    checksum is divisible by 4 (once the chunk has some length). These
+    boundaries depend only on the sentences themselves, so after an
+    edit the chunks line up again right after the changed part and
+    only those chunks need new audio.
+    """
+    chunks = []
+    current = ""
+    for sentence in SENTENCE_END.split(text):
+        # A sentence longer than a chunk is cut at spaces
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(' ', 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+        if len(current) >= max_chars // 4 and zlib.crc32(sentence.encode("utf-8")) % 4 == 0:
+            chunks.append(current)
+            current = ""
+    if current.strip():
+        chunks.append(current)
+    return [chunk for chunk in chunks if chunk]
+
+
+def iter_sentences(text, start=0):
+    """Yield (start, end) offsets of the sentences in text from `start` on.
+
+    Sentences are found lazily, so playback can begin right away no
+    matter how long the text is.
+    """
+    pos = start
+    for match in SENTENCE_END.finditer(text, start):
+        if text[pos:match.start()].strip():
+            yield pos, match.start()
+        pos = match.end()
+    if text[pos:].strip():
+        yield pos, len(text.rstrip())
+
+
+def split_into_chapters(text):
+    """Split text before every page that starts with a "Chapter N" heading.
+
+    There is one part if there are none. Anything before the first
+    chapter (title page, contents) is read as the start of it, and a
+    running header that repeats the current chapter's heading on the
+    next pages does not split again.
+    """
+    starts = [0]
+    current = None
+    for match in CHAPTER_START.finditer(text):
+        heading = ' '.join(match.group(1).split())
+        if heading != current:
+            starts.append(match.start())
+            current = heading
+    if len(starts) > 1:
+        del starts[1]
+    bounds = starts + [len(text)]
+    parts = [text[start:end].strip() for start, end in zip(bounds, bounds[1:])]
+    return [part for part in parts if part]
+
+
+def chunk_file_name(index, chunk, rate):
+    """Segment file name; it changes when the text or speed changes"""
+    digest = hashlib.sha1(f"{rate}\0{chunk}".encode("utf-8")).hexdigest()[:16]
+    return f"{index:05d}-{digest}.wav"
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class AudiobookCache:
+    """On-disk cache with a size budget and least-recently-used eviction.
+
+    text/<pdf sha256>-v<N>.json     cleaned text of every page
+    audio/<sha1>.wav                one rendered chunk, keyed by (text, voice, rate)
+
+    A hit touches the file's mtime, and eviction deletes the oldest
+    files first until the cache is back under max_bytes. Files touched
+    in the last EVICT_GRACE_SECONDS are kept even over the budget, so
+    a conversion running in another process does not lose segments
+    it has already counted as cached.
+    """
+
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.text_dir = os.path.join(root, 'text')
+        self.audio_dir = os.path.join(root, 'audio')
+        os.makedirs(self.text_dir, exist_ok=True)
+        os.makedirs(self.audio_dir, exist_ok=True)
+
+    @staticmethod
+    def _touch(path):
+        try:
+            os.utime(path)
+            return True
+        except OSError:
+            return False
+
+    def get_pages(self, pdf_hash):
+        """Cleaned [page_number, text] pairs for a PDF, or None"""
+        path = os.path.join(self.text_dir, f"{pdf_hash}-v{TEXT_VERSION}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                pages = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return pages
+
+    def put_pages(self, pdf_hash, pages):
+        path = os.path.join(self.text_dir, f"{pdf_hash}-v{TEXT_VERSION}.json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(pages, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def audio_path(self, chunk, voice, rate):
+        """Where the audio for this chunk is (or will be) stored"""
+        key = hashlib.sha1(f"{voice}\0{rate}\0{chunk}".encode("utf-8")).hexdigest()
+        return os.path.join(self.audio_dir, key + '.wav')
+
+    def has_audio(self, path):
+        return self._touch(path)
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits its budget"""
+        entries = []
+        total = 0
+        recent = time.time() - EVICT_GRACE_SECONDS
+        for folder in (self.text_dir, self.audio_dir):
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.name.endswith('.tmp') or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for mtime, size, path in entries:
+            if mtime >= recent:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+def open_cache():
+    """The shared cache, or None when it is turned off or cannot be created"""
+    if CACHE_MB <= 0:
+        return None
+    try:
+        return AudiobookCache()
+    except OSError as e:
+        print(f"Cache disabled: {e}")
+        return None
+
+
+def iter_clean_pages(pdf_path, cache=None, workers=None, cancel_event=None, on_total=None):
+    """Yield (page_number, cleaned_text) for every page, using the cache when possible.
+
+    on_total(page_count) is called before the first page. Blank pages
+    come out as empty strings.
+    """
+    pdf_hash = file_hash(pdf_path) if cache is not None else None
+    cached = cache.get_pages(pdf_hash) if pdf_hash else None
+    if cached is not None:
+        if on_total:
+            on_total(len(cached))
+        for page_num, page_text in cached:
+            yield page_num, page_text
+        return
+
+    total = count_pages(pdf_path)
+    if on_total:
+        on_total(total)
+    pages = []
+    for page_num, page_text in iter_pdf_pages(pdf_path, workers=workers, cancel_event=cancel_event, total=total):
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        # The heading is its own sentence so it is not read as part of the first line
+        page_text = clean_text(page_text)
+        page_text = f"Page {page_num}. {page_text}" if page_text else ""
+        pages.append([page_num, page_text])
+        yield page_num, page_text
+    if pdf_hash:
+        cache.put_pages(pdf_hash, pages)
+
+
+def render_chunk(chunk, wav_path, rate, voice=None):
+    """Render one chunk to a WAV file. Runs in a worker process."""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = pyttsx3.init()
+    _worker_engine.setProperty('rate', rate)
+    if voice:
+        _worker_engine.setProperty('voice', voice)
+
+    # Write under a temporary name so a half-written file is never reused
+    tmp_path = f"{wav_path}.{os.getpid()}.tmp"
+    _worker_engine.save_to_file(chunk, tmp_path)
+    _worker_engine.runAndWait()
+    os.replace(tmp_path, wav_path)
+    return wav_path
+
+
+def concat_wavs(wav_paths, out_path):
+    """Join WAV files with the same format into one file"""
+    with wave.open(out_path, 'wb') as out:
+        for i, path in enumerate(wav_paths):
+            with wave.open(path, 'rb') as part:
+                if i == 0:
+                    out.setparams(part.getparams())
+                out.writeframes(part.readframes(part.getnframes()))
+
+
+def synthesize(text, out_path, rate, workers=None, per_chapter=False, progress=None, cancel_event=None,
+               voice=None, cache=None):
+    """Render text to out_path chunk by chunk in worker processes.
+
+    With a cache, segments are looked up and stored there, so only
+    chunks whose text, voice or rate changed get rendered again.
+    Without one, segments are kept in "<out_path>.parts" until the
+    final file is written. Either way an interrupted run picks up where
+    it stopped. With per_chapter, every chapter goes to its own
+    "<name>_NN.wav" file. progress(done, total) is called after every
+    chunk. Returns the list of files written.
+    """
+    chapters = split_into_chapters(text) if per_chapter else [text]
+    chunks_per_chapter = [split_into_chunks(chapter) for chapter in chapters]
+    all_chunks = [chunk for chunks in chunks_per_chapter for chunk in chunks]
+    if not all_chunks:
+        raise ValueError("No text to synthesize")
+
+    if cache is not None:
+        parts_dir = None
+        segment_paths = [cache.audio_path(chunk, voice, rate) for chunk in all_chunks]
+        exists = cache.has_audio
+    else:
+        parts_dir = out_path + ".parts"
+        os.makedirs(parts_dir, exist_ok=True)
+        segment_paths = [os.path.join(parts_dir, chunk_file_name(i, chunk, rate))
+                         for i, chunk in enumerate(all_chunks)]
+        exists = os.path.exists
+
+    def missing():
+        # Segments already rendered (cached, or left from an interrupted run) are reused
+        todo = []
+        seen = set()
+        for i, path in enumerate(segment_paths):
+            if path not in seen and not exists(path):
+                todo.append(i)
+            seen.add(path)
+        return todo
+
+    def render(todo):
+        nonlocal done
+        if todo and workers == 1:
+            # Render in this process (e.g. when already running inside a batch worker)
+            for i in todo:
+                render_chunk(all_chunks[i], segment_paths[i], rate, voice)
+                done += 1
+                if progress:
+                    progress(done, len(all_chunks))
+                if cancel_event is not None and cancel_event.is_set():
+                    raise InterruptedError("Saving cancelled")
+        elif todo:
+            # Never in this process otherwise: in the GUI pyttsx3.init() would
+            # hand back the playback engine
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+                futures = [pool.submit(render_chunk, all_chunks[i], segment_paths[i], rate, voice) for i in todo]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                        done += 1
+                        if progress:
+                            progress(done, len(all_chunks))
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise InterruptedError("Saving cancelled")
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+    todo = missing()
+    done = len(all_chunks) - len(todo)
+    if progress:
+        progress(done, len(all_chunks))
+    render(todo)
+
+    if cache is not None:
+        # Touch every segment again right before joining them, and render
+        # any that another process evicted while this one was working
+        todo = missing()
+        done -= len(todo)
+        render(todo)
+
+    written = []
+    if per_chapter and len(chapters) > 1:
+        base, ext = os.path.splitext(out_path)
+        start = 0
+        for number, chunks in enumerate(chunks_per_chapter, 1):
+            chapter_path = f"{base}_{number:02d}{ext}"
+            concat_wavs(segment_paths[start:start + len(chunks)], chapter_path)
+            written.append(chapter_path)
+            start += len(chunks)
+    else:
+        concat_wavs(segment_paths, out_path)
+        written.append(out_path)
+
+    if parts_dir is not None:
+        shutil.rmtree(parts_dir, ignore_errors=True)
+    else:
+        cache.evict()
+    return written
+
 
 class SimpleAudiobookConverter:
     def __init__(self):
@@ -11,6 +536,14 @@ class SimpleAudiobookConverter:
         self.engine = pyttsx3.init()
         self.current_text = ""
         self.is_playing = False
+        self.play_position = 0  # offset in the preview text where playback continues
+        self.stop_requested = False
+        self.play_thread = None
+        self.play_events = None
+        self.start_pending = False  # Play pressed while the old run loop was still ending
+        self.extract_cancel = None  # set to stop the running extraction
+        self.is_saving = False
+        self.cache = open_cache()
         
         # Create GUI
         self.root = tk.Tk()
@@ -48,13 +581,28 @@ class SimpleAudiobookConverter:
         button_frame.pack(pady=20)
         
         ttk.Button(button_frame, text="Play Audio", command=self.play_audio).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Pause", command=self.pause_audio).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Stop Audio", command=self.stop_audio).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Save as WAV", command=self.save_audio).pack(side=tk.LEFT, padx=5)
+        self.per_chapter_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="One file per chapter",
+                        variable=self.per_chapter_var).pack(side=tk.LEFT, padx=5)
         
+        # Seek controls
+        seek_frame = ttk.Frame(self.root)
+        seek_frame.pack()
+        ttk.Label(seek_frame, text="Go to page:").pack(side=tk.LEFT)
+        self.page_var = tk.StringVar(value="1")
+        ttk.Entry(seek_frame, textvariable=self.page_var, width=6).pack(side=tk.LEFT, padx=5)
+        ttk.Button(seek_frame, text="Go", command=self.seek_to_page).pack(side=tk.LEFT)
+        ttk.Label(seek_frame, text="(or double-click a sentence)").pack(side=tk.LEFT, padx=5)
+
         # Text preview
         ttk.Label(self.root, text="📖 Text Preview:").pack(anchor=tk.W, padx=20, pady=(20,5))
         self.text_area = tk.Text(self.root, height=15, width=70, wrap=tk.WORD)
         self.text_area.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
+        self.text_area.tag_configure("reading", background="#fff3a0")
+        self.text_area.bind("<Double-Button-1>", self.seek_to_click)
         
         # Status
         self.status = ttk.Label(self.root, text="Ready")
@@ -82,43 +630,75 @@ class SimpleAudiobookConverter:
             self.extract_text(file_path)
     
     def extract_text(self, pdf_path):
+        # Stop an extraction that is still running for a previous file
+        if self.extract_cancel is not None:
+            self.extract_cancel.set()
+        cancel = threading.Event()
+        self.extract_cancel = cancel
+        events = queue.Queue()
+
+        if self.is_playing:
+            self.stop_audio()
+        self.play_position = 0
+        self.status.config(text="Extracting text...")
+        self.text_area.delete(1.0, tk.END)
+        self.current_text = ""
+        self.progress['value'] = 0
+
+        def extract_thread():
+            # Runs off the UI thread; results are passed back through the queue
+            try:
+                for page_num, page_text in iter_clean_pages(pdf_path, self.cache, cancel_event=cancel,
+                                                            on_total=lambda total: events.put(('total', total))):
+                    events.put(('page', page_num, page_text))
+                if not cancel.is_set():
+                    events.put(('done',))
+            except Exception as e:
+                events.put(('error', e))
+
+        threading.Thread(target=extract_thread, daemon=True).start()
+        self.root.after(50, self.poll_extraction, events, cancel, [])
+
+    def poll_extraction(self, events, cancel, pages):
+        """Move finished pages from the worker thread into the preview"""
+        if cancel.is_set():
+            return
         try:
-            self.status.config(text="Extracting text...")
-            self.root.update()
-            
-            # Open PDF and extract text using pdfplumber
-            text = ""
-            
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text and page_text.strip():
-                        text += f"Page {page_num}:\n{page_text}\n\n"
-            
-            if not text.strip():
-                raise Exception("No text found in PDF")
-            
-            # Clean text
-            text = self.clean_text(text)
-            self.current_text = text
-            
-            # Display in text area
-            self.text_area.delete(1.0, tk.END)
-            self.text_area.insert(1.0, text)
-            
-            word_count = len(text.split())
-            self.status.config(text=f"Ready - {word_count} words extracted")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to extract text: {str(e)}")
+            while True:
+                event = events.get_nowait()
+                if event[0] == 'total':
+                    self.progress['maximum'] = max(event[1], 1)
+                elif event[0] == 'page':
+                    page_num, page_text = event[1], event[2]
+                    self.progress['value'] = page_num
+                    if page_text:
+                        pages.append(page_text)
+                        self.text_area.insert(tk.END, page_text + "\n\n")
+                    self.status.config(text=f"Extracting text... page {page_num}")
+                elif event[0] == 'done':
+                    self.finish_extraction(pages)
+                    return
+                else:
+                    messagebox.showerror("Error", f"Failed to extract text: {str(event[1])}")
+                    self.status.config(text="Error extracting text")
+                    return
+        except queue.Empty:
+            pass
+        self.root.after(50, self.poll_extraction, events, cancel, pages)
+
+    def finish_extraction(self, pages):
+        if not pages:
+            messagebox.showerror("Error", "Failed to extract text: No text found in PDF")
             self.status.config(text="Error extracting text")
+            return
+
+        text = " ".join(pages)
+        self.current_text = text
+        word_count = len(text.split())
+        self.status.config(text=f"Ready - {word_count} words extracted")
     
     def clean_text(self, text):
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters that cause TTS issues
-        text = re.sub(r'[^\w\s.,!?;:()\-]', '', text)
-        return text.strip()
+        return clean_text(text)
     
     def play_audio(self):
         if not self.current_text:
@@ -128,32 +708,147 @@ class SimpleAudiobookConverter:
         if self.is_playing:
             messagebox.showinfo("Info", "Audio is already playing")
             return
+        if self.play_thread is not None and self.play_thread.is_alive():
+            # Just stopped: the engine can only run one loop, start once the old one ended
+            if not self.start_pending:
+                self.start_pending = True
+                self.root.after(50, self.start_when_idle)
+            return
         
         # Set TTS properties
         self.engine.setProperty('rate', self.speed_var.get())
-        
+
+        text = self.text_area.get(1.0, "end-1c")
+        if self.play_position >= len(text.rstrip()):
+            self.play_position = 0
+        sentences = iter_sentences(text, self.play_position)
+        events = queue.Queue()
+
+        def queue_next():
+            # Always keep the next sentence queued in the engine, so there is no gap
+            if self.stop_requested:
+                return
+            span = next(sentences, None)
+            if span is not None:
+                self.engine.say(text[span[0]:span[1]], f"{span[0]}:{span[1]}")
+
+        def on_start(name):
+            start, end = (int(x) for x in name.split(':'))
+            events.put(('position', start, end))
+            queue_next()
+
         def play_thread():
+            token = self.engine.connect('started-utterance', on_start)
             try:
-                self.is_playing = True
-                self.status.config(text="Playing audio...")
-                self.engine.say(self.current_text)
+                queue_next()
                 self.engine.runAndWait()
-                self.is_playing = False
-                self.status.config(text="Playback finished")
+                events.put(('stopped' if self.stop_requested else 'finished',))
             except Exception as e:
+                events.put(('error', e))
+            finally:
+                self.engine.disconnect(token)
+
+        self.is_playing = True
+        self.stop_requested = False
+        self.status.config(text="Playing audio...")
+        self.play_events = events
+        self.play_thread = threading.Thread(target=play_thread, daemon=True)
+        self.play_thread.start()
+        self.root.after(50, self.poll_playback, events)
+
+    def start_when_idle(self):
+        if self.play_thread is not None and self.play_thread.is_alive():
+            self.root.after(50, self.start_when_idle)
+            return
+        self.start_pending = False
+        self.play_audio()
+
+    def poll_playback(self, events):
+        """Highlight the sentence being read and keep track of the position"""
+        if events is not self.play_events:
+            return  # a newer playback has taken over
+        try:
+            while True:
+                event = events.get_nowait()
+                if event[0] == 'position':
+                    start, end = event[1], event[2]
+                    self.play_position = start
+                    self.text_area.tag_remove("reading", 1.0, tk.END)
+                    self.text_area.tag_add("reading", f"1.0 + {start} chars", f"1.0 + {end} chars")
+                    self.text_area.see(f"1.0 + {start} chars")
+                    continue
                 self.is_playing = False
-                messagebox.showerror("Error", f"Playback error: {str(e)}")
-                self.status.config(text="Playback error")
-        
-        threading.Thread(target=play_thread, daemon=True).start()
+                if event[0] == 'finished':
+                    self.play_position = 0
+                    self.text_area.tag_remove("reading", 1.0, tk.END)
+                    self.status.config(text="Playback finished")
+                elif event[0] == 'error':
+                    messagebox.showerror("Error", f"Playback error: {str(event[1])}")
+                    self.status.config(text="Playback error")
+                return
+        except queue.Empty:
+            pass
+        self.root.after(50, self.poll_playback, events)
+
+    def pause_audio(self):
+        if self.is_playing:
+            # play_position still points at the current sentence, Play resumes there
+            self.stop_requested = True
+            self.engine.stop()
+            self.status.config(text="Paused - press Play to resume")
+        else:
+            messagebox.showinfo("Info", "No audio is playing")
     
     def stop_audio(self):
+        # Also works while paused: is_playing is False then, but play_position is not 0
+        if not self.is_playing and self.play_position == 0:
+            messagebox.showinfo("Info", "No audio is playing")
+            return
         if self.is_playing:
+            self.stop_requested = True
             self.engine.stop()
             self.is_playing = False
-            self.status.config(text="Playback stopped")
-        else:
-            messagebox.showinfo("Info", "No audio is playing")
+        # Forget the old playback's events, a late 'position' would move play_position again
+        self.play_events = None
+        self.play_position = 0
+        self.text_area.tag_remove("reading", 1.0, tk.END)
+        self.status.config(text="Playback stopped")
+
+    def seek(self, position):
+        """Continue playback from a character offset in the preview"""
+        was_playing = self.is_playing
+        if was_playing:
+            self.stop_requested = True
+            self.engine.stop()
+        self.play_position = position
+        self.text_area.see(f"1.0 + {position} chars")
+        if was_playing:
+            self.root.after(50, self.restart_playback)
+
+    def restart_playback(self):
+        # The engine can only run one loop, wait for the old playback to end
+        if self.play_thread is not None and self.play_thread.is_alive():
+            self.root.after(50, self.restart_playback)
+            return
+        self.is_playing = False
+        self.play_audio()
+
+    def seek_to_page(self):
+        text = self.text_area.get(1.0, "end-1c")
+        position = text.find(f"Page {self.page_var.get().strip()}.")
+        if position < 0:
+            messagebox.showinfo("Info", f"Page {self.page_var.get()} not found")
+            return
+        self.seek(position)
+
+    def seek_to_click(self, event):
+        text = self.text_area.get(1.0, "end-1c")
+        clicked = len(self.text_area.get(1.0, f"@{event.x},{event.y}"))
+        # Start of the sentence that was clicked
+        start = 0
+        for match in SENTENCE_END.finditer(text, 0, clicked):
+            start = match.end()
+        self.seek(start)
     
     def save_audio(self):
         if not self.current_text:
@@ -166,29 +861,176 @@ class SimpleAudiobookConverter:
             filetypes=[("WAV files", "*.wav")]
         )
         
-        if file_path:
+        if not file_path:
+            return
+        if self.is_saving:
+            messagebox.showinfo("Info", "Audio is already being saved")
+            return
+
+        self.is_saving = True
+        self.status.config(text="Saving audio...")
+        self.progress['value'] = 0
+        events = queue.Queue()
+        # Use the preview text, so edits made there end up in the audio
+        preview = self.text_area.get(1.0, tk.END)
+        fallback = self.current_text
+        rate = self.speed_var.get()
+        voice = self.engine.getProperty('voice')
+        per_chapter = self.per_chapter_var.get()
+
+        def save_thread():
             try:
-                self.status.config(text="Saving audio...")
-                self.root.update()
-                
-                # Set TTS properties
-                self.engine.setProperty('rate', self.speed_var.get())
-                
-                # Save to file
-                self.engine.save_to_file(self.current_text, file_path)
-                self.engine.runAndWait()
-                
-                messagebox.showinfo("Success", f"Audio saved to {file_path}")
-                self.status.config(text="Audio saved successfully")
-                
+                # The preview is already cleaned: no second expansion pass ("Page 5." must
+                # stay as it is for split_into_chapters), only user edits are tidied up
+                text = clean_text(preview, expand=False) or fallback
+                written = synthesize(text, file_path, rate, per_chapter=per_chapter, voice=voice, cache=self.cache,
+                                     progress=lambda done, total: events.put(('progress', done, total)))
+                events.put(('done', written))
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to save audio: {str(e)}")
-                self.status.config(text="Error saving audio")
+                events.put(('error', e))
+
+        threading.Thread(target=save_thread, daemon=True).start()
+        self.root.after(100, self.poll_save, events)
+
+    def poll_save(self, events):
+        """Show chunk progress from the save thread"""
+        try:
+            while True:
+                event = events.get_nowait()
+                if event[0] == 'progress':
+                    done, total = event[1], event[2]
+                    self.progress['maximum'] = total
+                    self.progress['value'] = done
+                    self.status.config(text=f"Saving audio... {done}/{total} chunks")
+                elif event[0] == 'done':
+                    self.is_saving = False
+                    files = event[1]
+                    where = files[0] if len(files) == 1 else f"{len(files)} files ({files[0]}, ...)"
+                    messagebox.showinfo("Success", f"Audio saved to {where}")
+                    self.status.config(text="Audio saved successfully")
+                    return
+                else:
+                    self.is_saving = False
+                    messagebox.showerror("Error", f"Failed to save audio: {str(event[1])}\n"
+                                                  "Saving again will continue where it stopped.")
+                    self.status.config(text="Error saving audio")
+                    return
+        except queue.Empty:
+            pass
+        self.root.after(100, self.poll_save, events)
     
     def run(self):
         self.root.mainloop()
 
+def convert_document(pdf_path, out_path, rate, per_chapter=False):
+    """Convert one PDF without any GUI. Runs in a batch worker process."""
+    started = time.perf_counter()
+    result = {'pdf': pdf_path, 'output': out_path, 'status': 'converted'}
+    try:
+        cache = open_cache()
+        pages = [text for _, text in iter_clean_pages(pdf_path, cache, workers=1)]
+        result['pages'] = len(pages)
+        text = " ".join(page for page in pages if page)
+        if not text:
+            raise ValueError("No text found in PDF")
+        result['words'] = len(text.split())
+        os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+        result['files'] = synthesize(text, out_path, rate, workers=1, per_chapter=per_chapter, cache=cache)
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def is_up_to_date(pdf_path, out_path, per_chapter):
+    """True when the output exists and is newer than the PDF"""
+    if per_chapter:
+        base, ext = os.path.splitext(out_path)
+        candidates = [out_path, f"{base}_01{ext}"]
+    else:
+        candidates = [out_path]
+    pdf_mtime = os.path.getmtime(pdf_path)
+    return any(os.path.exists(path) and os.path.getmtime(path) >= pdf_mtime for path in candidates)
+
+
+def run_batch(input_dir, output_dir, rate=200, workers=None, per_chapter=False, force=False, report_path=None):
+    """Convert every PDF under input_dir to WAV files under output_dir.
+
+    Documents are converted in parallel by `workers` processes and the
+    folder structure is kept. PDFs whose output is newer than the PDF
+    are skipped unless force is set. A JSON report with timings, page
+    counts and failures is written to report_path (default:
+    output_dir/report.json). Returns the report.
+    """
+    started_at = datetime.now().isoformat(timespec='seconds')
+    started = time.perf_counter()
+    jobs = []
+    results = []
+    for folder, _, files in os.walk(input_dir):
+        for name in sorted(files):
+            if not name.lower().endswith('.pdf'):
+                continue
+            pdf_path = os.path.join(folder, name)
+            relative = os.path.relpath(pdf_path, input_dir)
+            out_path = os.path.join(output_dir, os.path.splitext(relative)[0] + '.wav')
+            if not force and is_up_to_date(pdf_path, out_path, per_chapter):
+                results.append({'pdf': pdf_path, 'output': out_path, 'status': 'skipped'})
+            else:
+                jobs.append((pdf_path, out_path))
+
+    print(f"{len(jobs)} PDF(s) to convert, {len(results)} already up to date")
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = {pool.submit(convert_document, pdf_path, out_path, rate, per_chapter): (pdf_path, out_path)
+                   for pdf_path, out_path in jobs}
+        for i, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+            except Exception as e:
+                # e.g. BrokenProcessPool when a worker crashed; the other files still get a report
+                pdf_path, out_path = futures[future]
+                result = {'pdf': pdf_path, 'output': out_path, 'status': 'failed', 'seconds': 0,
+                          'error': f"{type(e).__name__}: {e}"}
+            results.append(result)
+            detail = result.get('error') or f"{result.get('pages', 0)} pages, {result['seconds']}s"
+            print(f"[{i}/{len(jobs)}] {result['status']}: {result['pdf']} ({detail})")
+
+    counts = {status: sum(1 for r in results if r['status'] == status)
+              for status in ('converted', 'skipped', 'failed')}
+    report = {
+        'started': started_at,
+        'seconds': round(time.perf_counter() - started, 3),
+        'input_dir': input_dir,
+        'output_dir': output_dir,
+        'rate': rate,
+        **counts,
+        'files': sorted(results, key=lambda r: r['pdf']),
+    }
+    report_path = report_path or os.path.join(output_dir, 'report.json')
+    os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Converted {counts['converted']}, skipped {counts['skipped']}, failed {counts['failed']} "
+          f"- report saved to {report_path}")
+    return report
+
+
 # Main execution
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF to audiobook converter. Without --batch the GUI starts.")
+    parser.add_argument('--batch', nargs=2, metavar=('INPUT_DIR', 'OUTPUT_DIR'),
+                        help="convert every PDF in INPUT_DIR without the GUI")
+    parser.add_argument('--workers', type=int, default=None, help="documents converted at the same time")
+    parser.add_argument('--rate', type=int, default=200, help="speech speed in words per minute")
+    parser.add_argument('--per-chapter', action='store_true', help="write one file per chapter")
+    parser.add_argument('--force', action='store_true', help="convert even if the output is up to date")
+    parser.add_argument('--report', default=None, help="where to write the JSON report")
+    args = parser.parse_args()
+
+    if args.batch:
+        report = run_batch(args.batch[0], args.batch[1], rate=args.rate, workers=args.workers,
+                           per_chapter=args.per_chapter, force=args.force, report_path=args.report)
+        raise SystemExit(1 if report['failed'] else 0)
+
     app = SimpleAudiobookConverter()
     app.run()
@@ -1,29 +1,49 @@
-from flask import Flask, request, render_template_string, flash, redirect, url_for
+import atexit
+import bisect
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict, namedtuple
+from datetime import datetime, timezone
+
+from flask import Flask, request, render_template, flash, redirect, url_for, jsonify, abort, g, session
+from jinja2 import DictLoader
 
 app = Flask(__name__)
 app.secret_key = 'your-secret-key'
 
-# Your portfolio information - Edit this section with your details
-PORTFOLIO = {
-    'name': 'Naman Jain',
-    'title': 'Web Developer',
-    'email': 'naman2505jain@gmail.com',
-    'phone': '+91 98765 43210',
-    'github': 'https://github.com/JainNaman5',
-    'linkedin': 'https://www.linkedin.com/in/naman-jain-0182505n/',
-    'bio': 'I am a passionate web developer with experience in building modern web applications.',
-    
-    'skills': ['Python', 'Flask', 'HTML', 'CSS', 'JavaScript', 'React', 'Git'],
-    
-    'projects': [
-        {
-            'name': 'Web scrapper',
-            'description': 'A web scraper built with Python and BeautifulSoup',
-            'tech': 'Python, BeautifulSoup, HTML',
-            'link': 'https://github.com/JainNaman5/Intership_2025_python'
-        }
-    ]
-}
+# Where contact messages are stored (one JSON record per line)
+MESSAGES_FILE = os.environ.get('MESSAGES_FILE', 'messages.jsonl')
+# fsync policy: 'batch' (every group commit), 'interval' (at most once a second) or 'never'
+MESSAGES_FSYNC = os.environ.get('MESSAGES_FSYNC', 'batch')
+# Token needed to read messages through /messages (the route is disabled when empty)
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+
+# Contact form limits: messages per minute per IP (0 turns the limit off) and burst size
+CONTACT_RATE_LIMIT = float(os.environ.get('CONTACT_RATE_LIMIT', 5))
+CONTACT_RATE_BURST = int(os.environ.get('CONTACT_RATE_BURST', 3))
+# Optional SQLite file so all worker processes share the same buckets
+RATE_LIMIT_DB = os.environ.get('RATE_LIMIT_DB', '')
+MAX_MESSAGE_LENGTH = 5000
+HONEYPOT_FIELD = 'website'
+
+# Request metrics served at /metrics (set METRICS_ENABLED=0 to turn off)
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') != '0'
+# Sampling profiler: requests slower than this many ms get their stacks dumped (0 = off)
+PROFILE_SLOW_MS = float(os.environ.get('PROFILE_SLOW_MS', 0))
+PROFILE_INTERVAL_MS = float(os.environ.get('PROFILE_INTERVAL_MS', 5))
+PROFILE_FILE = os.environ.get('PROFILE_FILE', 'slow_requests.folded')
+
+# Your portfolio information lives in this file - edit it with your details.
+# Running servers pick up changes within CONTENT_POLL_SECONDS, no restart needed.
+PORTFOLIO_FILE = os.environ.get('PORTFOLIO_FILE',
+                                os.path.join(os.path.dirname(os.path.abspath(__file__)), 'portfolio.json'))
+CONTENT_POLL_SECONDS = float(os.environ.get('CONTENT_POLL_SECONDS', 2))
 
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -186,6 +206,12 @@ HTML_TEMPLATE = '''
             resize: vertical;
         }
 
+        /* Hidden from people, bots fill it in */
+        .hp-field {
+            position: absolute;
+            left: -10000px;
+        }
+
         .btn {
             background: #3498db;
             color: white;
@@ -317,7 +343,12 @@ HTML_TEMPLATE = '''
                 
                 <div class="form-group">
                     <label for="message">Message:</label>
-                    <textarea id="message" name="message" required></textarea>
+                    <textarea id="message" name="message" maxlength="{{ max_message_length }}" required></textarea>
+                </div>
+
+                <div class="hp-field" aria-hidden="true">
+                    <label for="{{ honeypot_field }}">Leave this empty:</label>
+                    <input type="text" id="{{ honeypot_field }}" name="{{ honeypot_field }}" tabindex="-1" autocomplete="off">
                 </div>
                 
                 <button type="submit" class="btn">Send Message</button>
@@ -335,12 +366,594 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+class MessageStore:
+    """Append-only JSONL store for contact messages.
+
+    Requests only put a record on a queue. A background thread takes
+    everything that is waiting and writes it with a single append
+    (group commit), so request latency does not depend on the disk.
+    A batch that fails to write (disk full, ...) is kept and retried
+    every retry_interval seconds together with newer messages.
+
+    Reading keeps an index of where every line starts and only scans
+    what was appended since the last read, so a page costs the same
+    however long the file gets.
+    """
+
+    def __init__(self, path, fsync='batch', batch_size=256, flush_interval=0.05, on_write=None,
+                 retry_interval=1.0):
+        if fsync not in ('batch', 'interval', 'never'):
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.path = path
+        self.fsync = fsync
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._last_fsync = 0.0
+        self.retry_interval = retry_interval
+        self.on_write = on_write  # called with the seconds each batch took
+        self._index_lock = threading.Lock()
+        self._offsets = []  # byte offset of every non-empty line
+        self._indexed = 0  # bytes of the file covered by _offsets
+        self._inode = None
+
+    def _ensure_started(self):
+        """Start the writer thread (again after a fork, e.g. in a worker process)"""
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._queue = queue.Queue()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name='message-writer', daemon=True)
+                self._thread.start()
+
+    def submit(self, name, email, message):
+        """Queue a message for writing and return immediately"""
+        self._ensure_started()
+        self._queue.put({
+            'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'name': name,
+            'email': email,
+            'message': message,
+        })
+
+    def flush(self, timeout=None):
+        """Block until every queued message has been written"""
+        if self._thread is None or self._pid != os.getpid():
+            return
+        if timeout is None:
+            self._queue.join()
+            return
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _run(self):
+        q = self._queue
+        failed = []  # records from batches that could not be written yet
+        while True:
+            if failed:
+                try:
+                    batch = [q.get(timeout=self.retry_interval)]
+                except queue.Empty:
+                    batch = []
+            else:
+                batch = [q.get()]
+            # Collect whatever else arrives shortly after, up to batch_size
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            batch = failed + batch
+            try:
+                self._write(batch)
+            except OSError as e:
+                print(f"Error writing {len(batch)} message(s), retrying in {self.retry_interval}s: {e}")
+                failed = batch
+                continue
+            failed = []
+            for _ in batch:
+                q.task_done()
+
+    def _write(self, batch):
+        started = time.perf_counter()
+        data = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in batch).encode('utf-8')
+        # O_APPEND + one write per batch keeps records from different
+        # worker processes from interleaving
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            now = time.monotonic()
+            if self.fsync == 'batch' or (self.fsync == 'interval' and now - self._last_fsync >= 1.0):
+                os.fsync(fd)
+                self._last_fsync = now
+        finally:
+            os.close(fd)
+        if self.on_write is not None:
+            self.on_write(time.perf_counter() - started)
+
+    def list_messages(self, page=1, per_page=20):
+        """Return (messages, total, page, per_page) for one page, newest first.
+
+        page and per_page come back clamped to what was actually used.
+        """
+        page = max(page, 1)
+        per_page = max(min(per_page, 100), 1)
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return [], 0, page, per_page
+        with f, self._index_lock:
+            offsets, indexed = self._update_index(f)
+            total = len(offsets)
+            end = total - (page - 1) * per_page
+            start = max(end - per_page, 0)
+            if start >= end:
+                return [], total, page, per_page
+            f.seek(offsets[start])
+            data = f.read((offsets[end] if end < total else indexed) - offsets[start])
+
+        messages = []
+        for line in reversed(data.splitlines()):
+            try:
+                messages.append(json.loads(line))
+            except ValueError:
+                continue  # skip a line that is not valid JSON
+        return messages, total, page, per_page
+
+    def _update_index(self, f):
+        """Add the lines appended since the last read to the offset index"""
+        st = os.fstat(f.fileno())
+        if st.st_ino != self._inode or st.st_size < self._indexed:
+            # A new or truncated file: index it from the start
+            self._offsets, self._indexed, self._inode = [], 0, st.st_ino
+        if st.st_size > self._indexed:
+            f.seek(self._indexed)
+            position = self._indexed
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # still being written, picked up next time
+                if line.strip():
+                    self._offsets.append(position)
+                position += len(line)
+            self._indexed = position
+        return self._offsets, self._indexed
+
+
+class TokenBucketLimiter:
+    """Per-IP token buckets kept in memory.
+
+    The table is an LRU OrderedDict with at most max_keys entries, and
+    buckets idle for longer than idle_timeout are dropped (an idle bucket
+    would be full again anyway). Every check is O(1).
+    """
+
+    def __init__(self, rate_per_minute, burst, max_keys=10000, idle_timeout=600):
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self.max_keys = max_keys
+        self.idle_timeout = idle_timeout
+        self._buckets = OrderedDict()  # key -> [tokens, last_update]
+        self._lock = threading.Lock()
+
+    def allow(self, key):
+        """Take one token for key, return False when the bucket is empty"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.pop(key, None)
+            if bucket is None:
+                bucket = [float(self.burst), now]
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            self._buckets[key] = bucket
+
+            # Oldest entries are at the front
+            while self._buckets:
+                oldest_key, oldest = next(iter(self._buckets.items()))
+                if len(self._buckets) <= self.max_keys and now - oldest[1] < self.idle_timeout:
+                    break
+                del self._buckets[oldest_key]
+
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return True
+            return False
+
+    def retry_after(self):
+        """Seconds until a new token is available"""
+        return max(1, int(1 / self.rate)) if self.rate else 60
+
+
+class SqliteTokenBucketLimiter(TokenBucketLimiter):
+    """Same token buckets, stored in a local SQLite file shared by all workers"""
+
+    def __init__(self, path, rate_per_minute, burst, idle_timeout=600):
+        super().__init__(rate_per_minute, burst, idle_timeout=idle_timeout)
+        self.path = path
+        self._local = threading.local()
+        self._calls = 0
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS buckets '
+                         '(key TEXT PRIMARY KEY, tokens REAL, updated REAL)')
+            self._local.conn = conn
+        return conn
+
+    def allow(self, key):
+        now = time.time()
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT tokens, updated FROM buckets WHERE key = ?', (key,)).fetchone()
+            tokens = float(self.burst) if row is None else min(self.burst, row[0] + (now - row[1]) * self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            conn.execute('INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)', (key, tokens, now))
+
+            # Clean up idle buckets now and then
+            self._calls += 1
+            if self._calls % 1000 == 0:
+                conn.execute('DELETE FROM buckets WHERE updated < ?', (now - self.idle_timeout,))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return allowed
+
+
+class SpamFilter:
+    """Cheap checks done before a message is queued for writing"""
+
+    def __init__(self, max_length=MAX_MESSAGE_LENGTH, honeypot_field=HONEYPOT_FIELD,
+                 max_hashes=10000, duplicate_window=3600):
+        self.max_length = max_length
+        self.honeypot_field = honeypot_field
+        self.max_hashes = max_hashes
+        self.duplicate_window = duplicate_window
+        self._seen = OrderedDict()  # message hash -> time first seen
+        self._lock = threading.Lock()
+
+    def check(self, form, name, email, message):
+        """Return None if the message looks fine, otherwise the reason it was rejected"""
+        if form.get(self.honeypot_field):
+            return 'honeypot'
+        if len(name) > 200 or len(email) > 320 or len(message) > self.max_length:
+            return 'too_long'
+
+        digest = hashlib.sha1(f"{email.lower()}\0{message}".encode('utf-8')).digest()
+        now = time.monotonic()
+        with self._lock:
+            while self._seen:
+                oldest_digest, seen_at = next(iter(self._seen.items()))
+                if len(self._seen) < self.max_hashes and now - seen_at < self.duplicate_window:
+                    break
+                del self._seen[oldest_digest]
+            if digest in self._seen:
+                return 'duplicate'
+            self._seen[digest] = now
+        return None
+
+
+Portfolio = namedtuple('Portfolio', 'name title email phone github linkedin bio skills projects')
+Project = namedtuple('Project', 'name description tech link')
+
+
+def parse_portfolio(data):
+    """Validate the JSON data and turn it into read-only tuples"""
+    if not isinstance(data, dict):
+        raise ValueError("portfolio must be a JSON object")
+
+    fields = {}
+    for field in ('name', 'title', 'email', 'phone', 'github', 'linkedin', 'bio'):
+        value = data.get(field, '')
+        if not isinstance(value, str):
+            raise ValueError(f"'{field}' must be a string")
+        fields[field] = value
+    if not fields['name']:
+        raise ValueError("'name' is required")
+
+    skills = data.get('skills', [])
+    if not isinstance(skills, list) or not all(isinstance(skill, str) for skill in skills):
+        raise ValueError("'skills' must be a list of strings")
+
+    projects = []
+    for i, project in enumerate(data.get('projects', []), 1):
+        if not isinstance(project, dict):
+            raise ValueError(f"project {i} must be an object")
+        values = {key: project.get(key, '') for key in Project._fields}
+        if not all(isinstance(value, str) for value in values.values()):
+            raise ValueError(f"project {i}: all fields must be strings")
+        if not values['name']:
+            raise ValueError(f"project {i}: 'name' is required")
+        projects.append(Project(**values))
+
+    return Portfolio(skills=tuple(skills), projects=tuple(projects), **fields)
+
+
+class ContentStore:
+    """Portfolio content loaded from PORTFOLIO_FILE and reloaded when it changes.
+
+    The file's mtime is checked at most every poll_interval seconds. A
+    new version is only swapped in after it parsed and validated, so a
+    broken edit keeps the old content live. The version number lets the
+    page cache know exactly when to re-render.
+    """
+
+    def __init__(self, path, poll_interval=2.0):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._stamp = None
+        self._current = (0, None)  # (version, Portfolio) - swapped as one object
+        self.reload()
+        if self._current[1] is None:
+            raise RuntimeError(f"Could not load portfolio content from {path}")
+
+    def _file_stamp(self):
+        st = os.stat(self.path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def reload(self):
+        """Load the file if it changed; returns True when new content was swapped in"""
+        with self._lock:
+            try:
+                stamp = self._file_stamp()
+            except OSError as e:
+                print(f"Error loading {self.path}: {e}")
+                return False
+            if stamp == self._stamp:
+                return False
+            # Remember the stamp even if loading fails, so a broken file is reported once
+            self._stamp = stamp
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    content = parse_portfolio(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"Error loading {self.path}: {e}")
+                return False
+            self._current = (self._current[0] + 1, content)
+            return True
+
+    def get(self):
+        """Return (version, Portfolio)"""
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.poll_interval
+            self.reload()
+        return self._current
+
+
+# Bucket bounds in seconds: 1-2-5 steps from 0.1 ms to 10 s
+LATENCY_BUCKETS = tuple(m * 10.0 ** e for e in range(-4, 1) for m in (1, 2, 5)) + (10.0,)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram in the Prometheus format"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last one is +Inf
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += seconds
+
+    def render(self, name, labels=''):
+        """Prometheus text lines; bucket counts are cumulative"""
+        with self._lock:
+            counts = list(self.counts)
+            total = self.total
+        sep = ',' if labels else ''
+        lines = []
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            lines.append(f'{name}_bucket{{{labels}{sep}le="{bound:g}"}} {running}')
+        running += counts[-1]
+        lines.append(f'{name}_bucket{{{labels}{sep}le="+Inf"}} {running}')
+        suffix = f'{{{labels}}}' if labels else ''
+        lines.append(f'{name}_sum{suffix} {total:.6f}')
+        lines.append(f'{name}_count{suffix} {running}')
+        return lines
+
+
+class Metrics:
+    """Per-route latency, status counts, template render and file write times"""
+
+    def __init__(self):
+        self.request_latency = {}  # (method, route) -> Histogram
+        self.responses = Counter()  # (method, route, status) -> count
+        self.template_render = Histogram()
+        self.file_write = Histogram()
+        self._lock = threading.Lock()
+
+    def observe_request(self, method, route, status, seconds):
+        key = (method, route)
+        histogram = self.request_latency.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.request_latency.setdefault(key, Histogram())
+        histogram.observe(seconds)
+        with self._lock:
+            self.responses[(method, route, status)] += 1
+
+    def render(self):
+        lines = ['# HELP portfolio_request_seconds Request latency by route.',
+                 '# TYPE portfolio_request_seconds histogram']
+        for (method, route), histogram in sorted(self.request_latency.items()):
+            lines += histogram.render('portfolio_request_seconds', f'method="{method}",route="{route}"')
+
+        lines += ['# HELP portfolio_responses_total Responses by route and status code.',
+                  '# TYPE portfolio_responses_total counter']
+        with self._lock:
+            responses = sorted(self.responses.items())
+        for (method, route, status), count in responses:
+            lines.append(f'portfolio_responses_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+
+        lines += ['# HELP portfolio_template_render_seconds Time spent rendering the page template.',
+                  '# TYPE portfolio_template_render_seconds histogram']
+        lines += self.template_render.render('portfolio_template_render_seconds')
+        lines += ['# HELP portfolio_message_write_seconds Time spent writing a batch of messages.',
+                  '# TYPE portfolio_message_write_seconds histogram']
+        lines += self.file_write.render('portfolio_message_write_seconds')
+        return '\n'.join(lines) + '\n'
+
+
+class SamplingProfiler:
+    """Samples the stacks of threads that are handling requests.
+
+    A background thread looks at sys._current_frames() every interval.
+    When a request turns out to be slower than the threshold, its stacks
+    are appended to a file in the folded format used by flamegraph.pl
+    and speedscope ("func;func;func count" per line).
+    """
+
+    def __init__(self, slow_ms, interval_ms, path):
+        self.slow_seconds = slow_ms / 1000.0
+        self.interval = interval_ms / 1000.0
+        self.path = path
+        self._active = {}  # thread id -> Counter of folded stacks
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def start_request(self):
+        if self._thread is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+            self._thread.start()
+        with self._lock:
+            self._active[threading.get_ident()] = Counter()
+
+    def end_request(self, label, seconds):
+        with self._lock:
+            stacks = self._active.pop(threading.get_ident(), None)
+        if not stacks or seconds < self.slow_seconds:
+            return
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            for stack, count in stacks.items():
+                f.write(f"{label};{stack} {count}\n")
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                thread_ids = list(self._active)
+            if not thread_ids:
+                continue
+            frames = sys._current_frames()
+            for thread_id in thread_ids:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                parts = []
+                while frame is not None:
+                    code = frame.f_code
+                    parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                stack = ';'.join(reversed(parts))
+                with self._lock:
+                    counter = self._active.get(thread_id)
+                    if counter is not None:
+                        counter[stack] += 1
+
+
+metrics = Metrics() if METRICS_ENABLED else None
+profiler = SamplingProfiler(PROFILE_SLOW_MS, PROFILE_INTERVAL_MS, PROFILE_FILE) if PROFILE_SLOW_MS > 0 else None
+
+if metrics is not None or profiler is not None:
+    @app.before_request
+    def start_timer():
+        g.request_started = time.perf_counter()
+        if profiler is not None:
+            profiler.start_request()
+
+    @app.after_request
+    def record_request(response):
+        started = g.pop('request_started', None)
+        if started is None:
+            return response
+        seconds = time.perf_counter() - started
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        if metrics is not None:
+            metrics.observe_request(request.method, route, response.status_code, seconds)
+        if profiler is not None:
+            profiler.end_request(f"{request.method} {route}", seconds)
+        return response
+
+
+content_store = ContentStore(PORTFOLIO_FILE, CONTENT_POLL_SECONDS)
+
+# Compiled once by Jinja and cached (render_template_string compiles on every call)
+app.jinja_loader = DictLoader({'portfolio.html': HTML_TEMPLATE})
+
+# Rendered home page for the current content version
+_page_cache = {}
+
+
+message_store = MessageStore(MESSAGES_FILE, fsync=MESSAGES_FSYNC,
+                             on_write=metrics.file_write.observe if metrics is not None else None)
+atexit.register(message_store.flush, 5.0)
+
+rate_limiter = None
+if CONTACT_RATE_LIMIT > 0:
+    if RATE_LIMIT_DB:
+        rate_limiter = SqliteTokenBucketLimiter(RATE_LIMIT_DB, CONTACT_RATE_LIMIT, CONTACT_RATE_BURST)
+    else:
+        rate_limiter = TokenBucketLimiter(CONTACT_RATE_LIMIT, CONTACT_RATE_BURST)
+spam_filter = SpamFilter()
+
 @app.route('/')
 def home():
-    return render_template_string(HTML_TEMPLATE, portfolio=PORTFOLIO)
+    global _page_cache
+    version, portfolio = content_store.get()
+    # Pages with flash messages are personal, everything else can be shared
+    cacheable = not session.get('_flashes')
+    if cacheable:
+        page = _page_cache.get(version)
+        if page is not None:
+            return page
+
+    started = time.perf_counter()
+    page = render_template('portfolio.html', portfolio=portfolio,
+                           max_message_length=MAX_MESSAGE_LENGTH, honeypot_field=HONEYPOT_FIELD)
+    if metrics is not None:
+        metrics.template_render.observe(time.perf_counter() - started)
+    if cacheable:
+        # Replacing the dict drops pages of older versions
+        _page_cache = {version: page}
+    return page
 
 @app.route('/contact', methods=['POST'])
 def contact():
+    # Reject floods before doing any other work
+    if rate_limiter is not None and not rate_limiter.allow(request.remote_addr or 'unknown'):
+        return ('Too many messages, please try again later.', 429,
+                {'Retry-After': str(rate_limiter.retry_after())})
+
     name = request.form.get('name', '').strip()
     email = request.form.get('email', '').strip()
     message = request.form.get('message', '').strip()
@@ -349,18 +962,113 @@ def contact():
     if not name or not email or not message:
         flash('All fields are required!', 'error')
         return redirect(url_for('home'))
+
+    problem = spam_filter.check(request.form, name, email, message)
+    if problem == 'too_long':
+        flash(f'Please keep your message under {MAX_MESSAGE_LENGTH} characters.', 'error')
+        return redirect(url_for('home'))
+    if problem is not None:
+        # Honeypot hits and duplicates look like a success, but are not saved
+        flash('Thank you! Your message has been sent.', 'success')
+        return redirect(url_for('home'))
     
-    # Save message to file
+    # Queue the message, the background writer saves it to file
     try:
-        with open('messages.txt', 'a', encoding='utf-8') as f:
-            f.write(f"Name: {name}\nEmail: {email}\nMessage: {message}\n{'-'*30}\n")
-        
+        message_store.submit(name, email, message)
         flash('Thank you! Your message has been sent.', 'success')
-    except:
+    except Exception:
         flash('Sorry, there was an error. Please try again.', 'error')
     
     return redirect(url_for('home'))
 
+@app.route('/metrics')
+def prometheus_metrics():
+    if metrics is None:
+        abort(404)
+    return metrics.render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+@app.route('/messages')
+def list_messages():
+    # Only available when an admin token is configured
+    token = request.headers.get('X-Admin-Token') or request.args.get('token', '')
+    if not ADMIN_TOKEN or token != ADMIN_TOKEN:
+        abort(404)
+
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', 20, type=int)
+    messages, total, page, per_page = message_store.list_messages(page, per_page)
+    return jsonify({'page': page, 'per_page': per_page, 'total': total, 'messages': messages})
+
+def run_waitress(host, port, threads, keepalive):
+    """Serve with waitress (multi-threaded, works on Windows too)"""
+    from waitress import serve  # pip install waitress
+    serve(app, host=host, port=port, threads=threads, channel_timeout=max(keepalive, 1))
+
+
+def run_gunicorn(host, port, workers, threads, keepalive):
+    """Serve with gunicorn pre-forked workers (Linux/macOS only)"""
+    from gunicorn.app.base import BaseApplication  # pip install gunicorn
+
+    class PortfolioApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f"{host}:{port}")
+            self.cfg.set('workers', workers)
+            self.cfg.set('threads', threads)
+            self.cfg.set('keepalive', keepalive)
+            self.cfg.set('worker_class', 'gthread' if threads > 1 else 'sync')
+
+        def load(self):
+            return app
+
+    PortfolioApplication().run()
+
+
+def run_threaded(host, port):
+    """Werkzeug server without the debugger, one thread per request.
+
+    Always a single process: werkzeug's processes= mode forks a child per
+    request that exits with os._exit, losing queued contact messages and
+    the rate limiter state. Use gunicorn for several processes.
+    """
+    from werkzeug.serving import run_simple
+    run_simple(host, port, app, threaded=True)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Portfolio website")
+    parser.add_argument('--server', choices=['dev', 'threaded', 'waitress', 'gunicorn'],
+                        default=os.environ.get('PORTFOLIO_SERVER', 'dev'),
+                        help="dev = Flask debug server (default), others are for production")
+    parser.add_argument('--host', default=os.environ.get('PORTFOLIO_HOST', '127.0.0.1'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORTFOLIO_PORT', 5000)))
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (gunicorn only; default: number of CPUs)")
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('PORTFOLIO_THREADS', 8)),
+                        help="threads per worker (gunicorn, waitress)")
+    parser.add_argument('--keepalive', type=int, default=None,
+                        help="seconds to keep idle connections open (waitress, gunicorn; default 5)")
+    args = parser.parse_args()
+    if args.server == 'threaded':
+        if args.keepalive is not None:
+            print("Note: --keepalive is ignored, werkzeug closes the connection after every response")
+        if args.workers is not None:
+            print("Note: --workers is ignored, the threaded server is one process (use gunicorn for more)")
+    if args.keepalive is None:
+        args.keepalive = int(os.environ.get('PORTFOLIO_KEEPALIVE', 5))
+    if args.workers is None:
+        args.workers = int(os.environ.get('PORTFOLIO_WORKERS', os.cpu_count() or 1))
+
+    print(f"Portfolio website running at: http://{args.host}:{args.port} ({args.server} server)")
+    if args.server == 'dev':
+        app.run(host=args.host, port=args.port, debug=True)
+    elif args.server == 'threaded':
+        run_threaded(args.host, args.port)
+    elif args.server == 'waitress':
+        run_waitress(args.host, args.port, args.threads, args.keepalive)
+    else:
+        run_gunicorn(args.host, args.port, args.workers, args.threads, args.keepalive)
+
 if __name__ == '__main__':
-    print("Portfolio website running at: http://127.0.0.1:5000")
-    app.run(debug=True)
\ No newline at end of file
+    main()
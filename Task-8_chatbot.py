@@ -1,16 +1,303 @@
-print("Hello! I'm ChatBot Flash. Type 'bye' to exit.")
-
-while True:
-    user_input = input("You: ").lower()
-
-    if user_input == "hello":
-        print("Faslh: Hi there! How can I help you?")
-    elif user_input == "how are you":
-        print("Flash: I'm just a bunch of code, but I'm doing great! 😄")
-    elif user_input == "what is your name":
-        print("Flash: I'm Flash, your friendly assistant.")
-    elif user_input == "bye":
-        print("Flash: Goodbye! Have a great day! 👋")
-        break
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+import re
+import time
+from collections import Counter, OrderedDict, defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # fuzzy matching falls back to plain Python
+    np = None
+
+INTENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'intents.json')
+
+NGRAM = 3  # character n-grams used for fuzzy matching
+MIN_SCORE = 0.5  # cosine similarity below this is "didn't understand"
+
+GREETING = "Hello! I'm ChatBot Flash. Type 'bye' to exit."
+HELP_HINT = "Type 'help' to see what I can do."
+
+
+def normalize(text):
+    """Lowercase, drop punctuation and extra spaces: "  What's your NAME?" -> "whats your name" """
+    text = re.sub(r"[^\w\s]", "", text.lower())
+    return " ".join(text.split())
+
+
+def char_ngrams(text):
+    """Counts of the character n-grams of " text ", e.g. " he", "hel", ..."""
+    padded = f" {text} "
+    return Counter(padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1))
+
+
+class IntentEngine:
+    """Finds the intent for a message.
+
+    Exact matches (after normalize) are one dict lookup. Anything else is
+    matched against every pattern by TF-IDF weighted character n-grams:
+    each n-gram keeps the patterns it occurs in (postings), so a message
+    only touches the patterns that share an n-gram with it, and NumPy adds
+    up the scores for all of them at once. Intents that end the
+    conversation ("end": true) only match exactly, so "see you never" or
+    "exit the door" does not hang up on the user.
+    """
+
+    def __init__(self, intents, fallback, min_score=MIN_SCORE):
+        self.intents = intents
+        self.fallback = fallback
+        self.min_score = min_score
+        self.exact = {}
+        pattern_intents = []
+        pattern_ngrams = []
+        for index, intent in enumerate(intents):
+            for pattern in intent['patterns']:
+                key = normalize(pattern)
+                if key and key not in self.exact:
+                    self.exact[key] = index
+                    if intent.get('end'):
+                        continue
+                    pattern_intents.append(index)
+                    pattern_ngrams.append(char_ngrams(key))
+        self.pattern_intents = pattern_intents
+
+        # Inverse document frequency of each n-gram over all patterns
+        document_count = Counter(gram for grams in pattern_ngrams for gram in grams)
+        total = len(pattern_ngrams)
+        self.idf = {gram: math.log((1 + total) / (1 + count)) + 1 for gram, count in document_count.items()}
+        self.unknown_idf = math.log(1 + total) + 1  # an n-gram no pattern has
+
+        # Postings: n-gram -> (pattern numbers, weights), weights already
+        # divided by the pattern vector's length so a sum is a cosine
+        postings = defaultdict(lambda: ([], []))
+        for number, grams in enumerate(pattern_ngrams):
+            weights = {gram: count * self.idf[gram] for gram, count in grams.items()}
+            length = math.sqrt(sum(w * w for w in weights.values()))
+            for gram, weight in weights.items():
+                ids, values = postings[gram]
+                ids.append(number)
+                values.append(weight / length)
+        if np is not None:
+            self.postings = {gram: (np.array(ids, dtype=np.int32), np.array(values, dtype=np.float32))
+                             for gram, (ids, values) in postings.items()}
+        else:
+            self.postings = dict(postings)
+
+    @classmethod
+    def from_file(cls, path=INTENTS_FILE):
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        return cls(data['intents'], data['fallback'])
+
+    def match(self, text):
+        """(intent index, score) for a message; index is None below min_score"""
+        key = normalize(text)
+        index = self.exact.get(key)
+        if index is not None:
+            return index, 1.0
+        if not key:
+            return None, 0.0
+
+        # Weight the message's n-grams the same way and keep the known ones
+        grams = char_ngrams(key)
+        query = {gram: count * self.idf[gram] for gram, count in grams.items() if gram in self.idf}
+        if not query:
+            return None, 0.0
+        # Unknown n-grams still make the message longer (and less similar),
+        # weighted like the rarest n-gram since no pattern has them
+        length = math.sqrt(sum(w * w for w in query.values())
+                           + sum((count * self.unknown_idf) ** 2 for gram, count in grams.items()
+                                 if gram not in self.idf))
+
+        if np is not None:
+            ids = np.concatenate([self.postings[gram][0] for gram in query])
+            weights = np.concatenate([self.postings[gram][1] * (weight / length) for gram, weight in query.items()])
+            scores = np.bincount(ids, weights=weights, minlength=len(self.pattern_intents))
+            best = int(scores.argmax())
+            score = float(scores[best])
+        else:
+            scores = defaultdict(float)
+            for gram, weight in query.items():
+                ids, values = self.postings[gram]
+                for number, value in zip(ids, values):
+                    scores[number] += value * weight / length
+            best, score = max(scores.items(), key=lambda item: item[1])
+
+        if score < self.min_score:
+            return None, score
+        return self.pattern_intents[best], score
+
+    def reply(self, text):
+        """(response, intent or None) for one message"""
+        index, _ = self.match(text)
+        if index is None:
+            return self.fallback, None
+        intent = self.intents[index]
+        return random.choice(intent['responses']), intent
+
+
+class Session:
+    """What the bot remembers about one conversation"""
+    __slots__ = ('id', 'writer', 'last_seen', 'messages', 'misses')
+
+    def __init__(self, session_id, writer=None):
+        self.id = session_id
+        self.writer = writer  # the connection, for server sessions
+        self.last_seen = time.monotonic()
+        self.messages = 0
+        self.misses = 0  # messages in a row the bot did not understand
+
+
+def converse(engine, session, text):
+    """Reply to one message of a session; returns (response, end of conversation)"""
+    response, intent = engine.reply(text)
+    session.messages += 1
+    if intent is None:
+        session.misses += 1
+        if session.misses >= 2:
+            response = f"{response} {HELP_HINT}"
     else:
-        print("Flash: Sorry, I didn't understand that. Can you try something else?")
+        session.misses = 0
+    return response, intent is not None and bool(intent.get('end'))
+
+
+# ---------------- Server mode ----------------
+# Plain TCP, one line per message: the server greets, then answers every
+# line with one "Flash: ..." line, and closes after a goodbye.
+
+class SessionTable:
+    """Open sessions, least recently active first.
+
+    At most max_sessions are kept (new connections are turned away when
+    full), and sessions idle for idle_timeout seconds are closed by
+    expire(). Both only look at the front of the OrderedDict.
+    """
+
+    def __init__(self, max_sessions=10000, idle_timeout=300):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._sessions = OrderedDict()
+        self._ids = itertools.count(1)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def open(self, writer):
+        """A new Session, or None when the table is full"""
+        self.expire()
+        if len(self._sessions) >= self.max_sessions:
+            return None
+        session = Session(next(self._ids), writer)
+        self._sessions[session.id] = session
+        return session
+
+    def touch(self, session):
+        session.last_seen = time.monotonic()
+        self._sessions.move_to_end(session.id)
+
+    def close(self, session):
+        self._sessions.pop(session.id, None)
+
+    def expire(self):
+        """Drop and disconnect sessions idle for too long; returns how many"""
+        now = time.monotonic()
+        expired = 0
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_seen < self.idle_timeout:
+                break
+            del self._sessions[session.id]
+            if session.writer is not None:
+                session.writer.close()
+            expired += 1
+        return expired
+
+
+async def handle_client(reader, writer, engine, sessions):
+    session = sessions.open(writer)
+    if session is None:
+        writer.write(b"Flash: Too many people are chatting right now, please try again later.\n")
+        writer.close()
+        return
+    try:
+        writer.write(f"Flash: {GREETING}\n".encode('utf-8'))
+        await writer.drain()
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:  # longer than the reader's limit
+                writer.write(b"Flash: That message is too long for me.\n")
+                break
+            if not line:
+                break
+            sessions.touch(session)
+            response, end = converse(engine, session, line.decode('utf-8', 'replace'))
+            writer.write(f"Flash: {response}\n".encode('utf-8'))
+            await writer.drain()
+            if end:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        sessions.close(session)
+        writer.close()
+
+
+async def expire_sessions(sessions, interval):
+    while True:
+        await asyncio.sleep(interval)
+        sessions.expire()
+
+
+async def serve(engine, host='127.0.0.1', port=8766, max_sessions=10000, idle_timeout=300):
+    sessions = SessionTable(max_sessions, idle_timeout)
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_client(reader, writer, engine, sessions),
+        host, port, limit=4096, backlog=1024,
+    )
+    print(f"ChatBot Flash listening on {host}:{port} (max {max_sessions} sessions, {idle_timeout}s idle timeout)")
+    sweeper = asyncio.create_task(expire_sessions(sessions, min(idle_timeout, 5)))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        sweeper.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ChatBot Flash")
+    parser.add_argument('--intents', default=INTENTS_FILE, help="intents and responses (JSON)")
+    parser.add_argument('--serve', action='store_true', help="chat with many people over TCP instead of the terminal")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--max-sessions', type=int, default=10000)
+    parser.add_argument('--idle-timeout', type=float, default=300, help="seconds before an idle session is closed")
+    args = parser.parse_args()
+
+    engine = IntentEngine.from_file(args.intents)
+    if args.serve:
+        try:
+            asyncio.run(serve(engine, args.host, args.port, args.max_sessions, args.idle_timeout))
+        except KeyboardInterrupt:
+            print("Goodbye!")
+        return
+
+    print(GREETING)
+    session = Session(0)
+    while True:
+        try:
+            user_input = input("You: ")
+        except EOFError:
+            break
+        response, end = converse(engine, session, user_input)
+        print(f"Flash: {response}")
+        if end:
+            break
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark for the calculator expression engine (calculator.py)
+
+Compares, on the same random formulas:
+  - parse + tree-walking interpretation every time (no caching)
+  - tree-walking interpretation of an already parsed tree
+  - the compiled closure from compile_expression (cached by source)
+the batch mode with repeated and with all-unique lines, and the float,
+decimal and fraction backends on money-style formulas (throughput and
+how far each one drifts from the exact answer).
+
+    python bench_calculator.py [--formulas 200] [--evals 200000] [--precision 28]
+"""
+import argparse
+import random
+import time
+
+import calculator
+
+
+def random_expression(rng, depth=0):
+    if depth > 3 or rng.random() < 0.3:
+        return rng.choice(['x', 'y', str(rng.randint(1, 99)), f"{rng.uniform(0, 10):.2f}"])
+    op = rng.choice(['+', '-', '*', '/', '**'])
+    left = random_expression(rng, depth + 1)
+    right = random_expression(rng, depth + 1) if op != '**' else str(rng.randint(0, 3))
+    return f"({left} {op} {right})"
+
+
+def money_expression(rng):
+    """Prices with cents, quantities, tax and discount rates"""
+    price, qty = f"{rng.randint(1, 99999) / 100:.2f}", rng.randint(1, 50)
+    tax, discount = f"0.{rng.randint(1, 25):02d}", f"0.{rng.randint(0, 30):02d}"
+    return rng.choice([
+        f"{price} * {qty} * (1 + {tax})",
+        f"{price} * {qty} * (1 - {discount}) + {price} * {tax}",
+        f"({price} + {price} * {tax}) / {qty}",
+        f"{price} * (1 + {tax} / 12) ** 12 - {price}",
+    ])
+
+
+def count_errors(lines, mode='float'):
+    return sum(1 for result in calculator.evaluate_lines(lines, mode) if result.startswith("Error"))
+
+
+def evaluate_all(lines, mode):
+    compile_expression = calculator.compile_expression
+    return [compile_expression(line, mode)({}) for line in lines]
+
+
+def run(label, func, count):
+    started = time.perf_counter()
+    errors = func()
+    seconds = time.perf_counter() - started
+    print(f"{label:<44}{count / seconds:>14,.0f} evals/s  ({seconds:.2f}s, {errors} errors)")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the calculator expression engine")
+    parser.add_argument('--formulas', type=int, default=200, help="distinct formulas")
+    parser.add_argument('--evals', type=int, default=200000, help="evaluations per variant")
+    parser.add_argument('--precision', type=int, default=28, help="significant digits for the decimal backend")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    formulas = [random_expression(rng) for _ in range(args.formulas)]
+    work = [(formulas[i % len(formulas)], {'x': rng.uniform(1, 5), 'y': rng.uniform(1, 5)})
+            for i in range(args.evals)]
+    trees = {source: calculator.parse(source) for source in formulas}
+    calculator.compile_expression.cache_clear()
+
+    def parse_and_interpret():
+        errors = 0
+        for source, env in work:
+            try:
+                calculator.interpret(calculator.parse(source), env)
+            except ArithmeticError:
+                errors += 1
+        return errors
+
+    def interpret_parsed():
+        errors = 0
+        for source, env in work:
+            try:
+                calculator.interpret(trees[source], env)
+            except ArithmeticError:
+                errors += 1
+        return errors
+
+    def compiled():
+        errors = 0
+        compile_expression = calculator.compile_expression
+        for source, env in work:
+            try:
+                compile_expression(source)(env)
+            except ArithmeticError:
+                errors += 1
+        return errors
+
+    print(f"{args.formulas} formulas, {args.evals:,} evaluations each\n")
+    baseline = run("parse + interpret every time", parse_and_interpret, len(work))
+    tree = run("interpret pre-parsed tree", interpret_parsed, len(work))
+    fast = run("compiled closure (LRU cached)", compiled, len(work))
+    print(f"\ncompiled vs parse + interpret: {baseline / fast:.1f}x, vs interpret tree: {tree / fast:.1f}x")
+
+    # Batch mode: constant expressions, one per line
+    repeated = [f"{rng.randint(1, 99)} * ({rng.randint(1, 99)} + {rng.randint(1, 99)}) / 7"
+                for _ in range(args.formulas)]
+    repeated_lines = [repeated[i % len(repeated)] for i in range(args.evals)]
+    unique_lines = [f"{i} * ({i % 97} + 3) / 7" for i in range(args.evals)]
+    print()
+    calculator.compile_expression.cache_clear()
+    run("batch, repeated lines", lambda: count_errors(repeated_lines), args.evals)
+    calculator.compile_expression.cache_clear()
+    run("batch, all lines unique", lambda: count_errors(unique_lines), args.evals)
+
+    # Backends on money formulas, every line unique so parsing is included
+    calculator.set_decimal_context(args.precision)
+    money_lines = [money_expression(rng) for _ in range(args.evals)]
+    print(f"\nbackends, {args.evals:,} unique money formulas (decimal precision {args.precision})")
+    results = {}
+    for mode in ('float', 'decimal', 'fraction'):
+        calculator.compile_expression.cache_clear()
+        run(f"batch, {mode}", lambda: count_errors(money_lines, mode), args.evals)
+        results[mode] = evaluate_all(money_lines, mode)
+
+    # Fractions are exact, so they are the reference for the other two
+    exact = results['fraction']
+    for mode in ('float', 'decimal'):
+        drift = max(abs(calculator.Fraction(value) - reference) for value, reference in zip(results[mode], exact))
+        wrong_cents = sum(round(calculator.Fraction(value), 2) != round(reference, 2)
+                          for value, reference in zip(results[mode], exact))
+        print(f"{mode + ' max error vs exact':<44}{float(drift):>14.3g}  ({wrong_cents} results off by a cent)")
+    total = {mode: sum(values, calculator.BACKENDS[mode].number('0')) for mode, values in results.items()}
+    print(f"{'sum of all results':<44}float {total['float']!r}\n{'':<44}decimal {total['decimal']}"
+          f"\n{'':<44}exact {float(total['fraction'])!r}")
+
+
+if __name__ == '__main__':
+    main()
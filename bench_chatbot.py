@@ -0,0 +1,118 @@
+"""
+Benchmark for the chatbot intent engine (Task-8_chatbot.py)
+
+Builds a synthetic set of intents (10k by default, a few patterns each)
+and measures per-message latency for exact messages, messages with a
+typo and messages that match nothing, against a linear scan over the
+patterns like the old if/elif chain did.
+
+    python bench_chatbot.py [--intents 10000] [--messages 2000]
+"""
+import argparse
+import importlib.util
+import os
+import random
+import string
+import time
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Task-8_chatbot.py')
+
+
+def load_app():
+    spec = importlib.util.spec_from_file_location('chatbot', APP_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_intents(count, seed=7):
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+                  for _ in range(3000)]
+    intents = []
+    for number in range(count):
+        topic = rng.sample(vocabulary, 2)  # patterns of one intent share some words
+        patterns = [' '.join(topic + rng.sample(vocabulary, rng.randint(1, 4))) for _ in range(rng.randint(2, 5))]
+        intents.append({'name': f'intent{number}', 'patterns': patterns, 'responses': [f'Reply {number}']})
+    return intents, vocabulary
+
+
+def add_typo(rng, text):
+    """Drop, repeat or swap one letter"""
+    i = rng.randrange(1, len(text) - 1)
+    kind = rng.choice(['drop', 'repeat', 'swap'])
+    if kind == 'drop':
+        return text[:i] + text[i + 1:]
+    if kind == 'repeat':
+        return text[:i] + text[i] + text[i:]
+    return text[:i - 1] + text[i] + text[i - 1] + text[i + 1:]
+
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(label, func, messages):
+    times = []
+    results = []
+    for message in messages:
+        started = time.perf_counter()
+        results.append(func(message))
+        times.append(time.perf_counter() - started)
+    times.sort()
+    print(f"{label:<36}{percentile(times, 50) * 1e6:>10.1f}{percentile(times, 99) * 1e6:>10.1f}"
+          f"{len(messages) / sum(times):>14,.0f}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the chatbot intent engine")
+    parser.add_argument('--intents', type=int, default=10000, help="number of intents")
+    parser.add_argument('--messages', type=int, default=2000, help="messages per variant")
+    args = parser.parse_args()
+
+    app = load_app()
+    intents, vocabulary = make_intents(args.intents)
+    started = time.perf_counter()
+    engine = app.IntentEngine(intents, "Sorry, I didn't understand that.")
+    print(f"{args.intents:,} intents, {len(engine.pattern_intents):,} patterns, "
+          f"index built in {time.perf_counter() - started:.2f}s (NumPy: {app.np is not None})\n")
+
+    rng = random.Random(1)
+    expected = []
+    exact, typos = [], []
+    for _ in range(args.messages):
+        index = rng.randrange(len(intents))
+        pattern = rng.choice(intents[index]['patterns'])
+        expected.append(index)
+        exact.append(pattern.upper() + '?')
+        typos.append(add_typo(rng, pattern))
+    unknown = [' '.join(rng.choice(vocabulary)[::-1] for _ in range(4)) for _ in range(args.messages)]
+
+    # What the if/elif chain does, as a loop over (pattern, intent) pairs
+    chain = [(app.normalize(pattern), index) for index, intent in enumerate(intents) for pattern in intent['patterns']]
+
+    def linear_scan(message):
+        key = app.normalize(message)
+        for pattern, index in chain:
+            if key == pattern:
+                return index
+        return None
+
+    print(f"{'per message':<36}{'p50 us':>10}{'p99 us':>10}{'msgs/s':>14}")
+    scanned = measure("linear scan, exact message", linear_scan, exact)
+    measure("linear scan, no match", linear_scan, unknown)
+    matched = measure("engine, exact message", lambda m: engine.match(m)[0], exact)
+    fuzzy = measure("engine, message with a typo", lambda m: engine.match(m)[0], typos)
+    missed = measure("engine, no match", lambda m: engine.match(m)[0], unknown)
+
+    print(f"\nexact messages answered correctly: linear {sum(a == b for a, b in zip(scanned, expected))}"
+          f"/{args.messages}, engine {sum(a == b for a, b in zip(matched, expected))}/{args.messages}")
+    print(f"typos matched to the right intent: {sum(a == b for a, b in zip(fuzzy, expected))}/{args.messages}"
+          f" (the linear scan gets none)")
+    print(f"unknown messages falling back: {sum(a is None for a in missed)}/{args.messages}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Micro-benchmark for the audiobook text normalization (Final_project_pdf_to-audio.py)
+
+Builds a synthetic corpus of extracted PDF pages (~5 MB by default) and
+compares the old approach - "Page N:" headers glued onto one big string,
+then two full-document re.sub passes - with the current per-page
+clean_text(), both doing the same work and with the TTS expansions on.
+
+    python bench_clean_text.py [--mb 5] [--repeat 3]
+"""
+import argparse
+import importlib.util
+import os
+import random
+import re
+import time
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Final_project_pdf_to-audio.py')
+
+WORDS = ('the of and to in is was for on that with as by at from this be are it an or which '
+         'analysis results section method chapter figure table data model value system '
+         'café naïve résumé über').split()
+EXTRAS = ['Dr.', 'Mr.', 'e.g.', 'i.e.', 'etc.', '42', '1,234', '3.14', '2024', '15%', '&',
+          '"quoted"', '[1]', '•', '→', '©', '$10', '(see Fig. 3)', 'well-\nknown']
+
+
+def load_app():
+    spec = importlib.util.spec_from_file_location('audiobook', APP_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_corpus(megabytes, seed=42):
+    """List of page texts that look like pdfplumber output"""
+    rng = random.Random(seed)
+    pages = []
+    size = 0
+    while size < megabytes * 1024 * 1024:
+        lines = []
+        for _ in range(45):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(8, 14))]
+            if rng.random() < 0.5:
+                words.insert(rng.randrange(len(words)), rng.choice(EXTRAS))
+            lines.append(' '.join(words) + rng.choice(['.', ',', '', ';', '!']))
+        page = '\n'.join(lines)
+        pages.append(page)
+        size += len(page)
+    return pages
+
+
+def old_clean(pages):
+    """What extract_text + clean_text used to do"""
+    text = ""
+    for page_num, page_text in enumerate(pages, 1):
+        text += f"Page {page_num}:\n{page_text}\n\n"
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s.,!?;:()\-]', '', text)
+    return text.strip()
+
+
+def new_clean(app, pages, expand=True):
+    """Per-page normalization as iter_clean_pages does it"""
+    cleaned = []
+    for page_num, page_text in enumerate(pages, 1):
+        page_text = app.clean_text(page_text, expand)
+        if page_text:
+            cleaned.append(f"Page {page_num}. {page_text}")
+    return " ".join(cleaned)
+
+
+def best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark text normalization")
+    parser.add_argument('--mb', type=float, default=5, help="corpus size in MB")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per variant (best is shown)")
+    args = parser.parse_args()
+
+    app = load_app()
+    pages = make_corpus(args.mb)
+    chars = sum(len(page) for page in pages)
+    print(f"Corpus: {len(pages)} pages, {chars / 1024 / 1024:.1f} MB")
+
+    old_seconds = best_time(lambda: old_clean(pages), args.repeat)
+    plain_seconds = best_time(lambda: new_clean(app, pages, expand=False), args.repeat)
+    full_seconds = best_time(lambda: new_clean(app, pages), args.repeat)
+
+    print(f"{'old: headers + two full-document re.sub passes':<52}{old_seconds * 1000:>10.1f} ms")
+    print(f"{'new: per-page clean_text, same work (expand=False)':<52}{plain_seconds * 1000:>10.1f} ms"
+          f"  ({old_seconds / plain_seconds:.1f}x)")
+    print(f"{'new: per-page clean_text with TTS expansions':<52}{full_seconds * 1000:>10.1f} ms"
+          f"  ({old_seconds / full_seconds:.1f}x)")
+
+if __name__ == '__main__':
+    main()
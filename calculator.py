@@ -1,3 +1,20 @@
+import argparse
+import decimal
+import itertools
+import math
+import operator
+import re
+import sys
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+
+try:
+    import numpy as np  # only needed for array mode
+except ImportError:
+    np = None
+
+
 def add(a, b):
     return a + b
 
@@ -10,46 +27,646 @@ def multiply(a, b):
 def divide(a, b):
     return a / b
 
-while True:
-    print("\nSelect operations: ")  
-    print("1. Add")
-    print("2. Subtract")
-    print("3. Multiply")
-    print("4. Divide")
-    print("5. Exit")
-
-    choice = input("Enter choice (1-5): ")  
-
-    if choice == '5':
-        print("See ya!")
-        break
-
-    if choice in ['1', '2', '3', '4']:
-        try:  
-            num1 = float(input("Enter first number: "))  
-            num2 = float(input("Enter second number: "))  
-
-            if choice == '1':
-                result = add(num1, num2)
-                print(f"Result: {num1} + {num2} = {result}")  
-
-            elif choice == '2':
-                result = subtract(num1, num2)
-                print(f"Result: {num1} - {num2} = {result}")  
-
-            elif choice == '3':
-                result = multiply(num1, num2)
-                print(f"Result: {num1} * {num2} = {result}")  
-
-            elif choice == '4':
-                if num2 != 0:
-                    result = divide(num1, num2)
-                    print(f"Result: {num1} / {num2} = {result}")  
-                else:
-                    print("Error: Cannot divide by zero!") 
+
+# ---------------- Expression engine ----------------
+# Expressions like "2 * (3 + x) ** 2" are tokenized, parsed into a small
+# tree of tuples and compiled into nested Python closures. Compiled
+# expressions are cached by their source text, so evaluating the same
+# formula again skips all parsing.
+
+class ExpressionError(ValueError):
+    """Raised for expressions that cannot be parsed or evaluated"""
+
+
+def real_power(a, b):
+    # float ** float gives a complex number for a negative base, e.g. (-8) ** 0.5
+    result = a ** b
+    if isinstance(result, complex):
+        raise ExpressionError(f"Cannot raise negative {a} to the fractional power {b}")
+    return result
+
+
+TOKEN = re.compile(r'\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(\*\*|[-+*/%^(),]))')
+
+BINARY_OPERATORS = {
+    '+': add,
+    '-': subtract,
+    '*': multiply,
+    '/': divide,
+    '%': operator.mod,
+    '**': real_power,
+}
+
+def round_to(a, digits=0):
+    # Numbers are parsed as floats (or Decimals), round() wants an int here
+    return round(a, int(digits))
+
+
+FUNCTIONS = {
+    'abs': abs,
+    'sqrt': math.sqrt,
+    'min': min,
+    'max': max,
+    'round': round_to,
+}
+
+CONSTANTS = {
+    'pi': math.pi,
+    'e': math.e,
+}
+
+
+def tokenize(source):
+    """Split an expression into ('num' | 'name' | 'op', text) tokens"""
+    tokens = []
+    pos = 0
+    source = source.rstrip()
+    while pos < len(source):
+        match = TOKEN.match(source, pos)
+        if match is None:
+            raise ExpressionError(f"Unexpected character {source[pos:].lstrip()[:1]!r}")
+        number, name, op = match.groups()
+        if number is not None:
+            tokens.append(('num', number))
+        elif name is not None:
+            tokens.append(('name', name))
+        else:
+            tokens.append(('op', '**' if op == '^' else op))
+        pos = match.end()
+    return tokens
+
+
+class Parser:
+    """Recursive descent parser, builds a tree of tuples:
+
+    ('num', text)  ('var', name)  ('neg', node)
+    ('bin', op, left, right)  ('call', name, [args])
+    ('chain', first, [(op, node), ...])  for a + b - c ... with more than one operator,
+    so long left associative chains do not nest (and recurse) once per term
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, text=None):
+        kind, value = self.peek()
+        if kind is None or (text is not None and value != text):
+            raise ExpressionError(f"Expected {text!r}" if text else "Unexpected end of expression")
+        self.pos += 1
+        return kind, value
+
+    def parse(self):
+        node = self.expression()
+        if self.pos != len(self.tokens):
+            raise ExpressionError(f"Unexpected {self.peek()[1]!r}")
+        return node
+
+    def expression(self):
+        return self.chain(self.term, ('+', '-'))
+
+    def term(self):
+        return self.chain(self.unary, ('*', '/', '%'))
+
+    def chain(self, operand, ops):
+        first = operand()
+        rest = []
+        while self.peek()[0] == 'op' and self.peek()[1] in ops:
+            op = self.take()[1]
+            rest.append((op, operand()))
+        if not rest:
+            return first
+        if len(rest) == 1:
+            return ('bin', rest[0][0], first, rest[0][1])
+        return ('chain', first, rest)
+
+    def unary(self):
+        if self.peek() == ('op', '-'):
+            self.take()
+            return ('neg', self.unary())
+        if self.peek() == ('op', '+'):
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        node = self.atom()
+        if self.peek() == ('op', '**'):
+            self.take()
+            # Right associative: 2 ** 3 ** 2 == 2 ** 9
+            node = ('bin', '**', node, self.unary())
+        return node
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == 'num':
+            return ('num', value)  # converted by the backend when compiling
+        if kind == 'name':
+            if self.peek() == ('op', '('):
+                self.take('(')
+                args = []
+                if self.peek() != ('op', ')'):
+                    args.append(self.expression())
+                    while self.peek() == ('op', ','):
+                        self.take()
+                        args.append(self.expression())
+                self.take(')')
+                if value not in FUNCTIONS:
+                    raise ExpressionError(f"Unknown function {value!r}")
+                return ('call', value, args)
+            return ('var', value)
+        if value == '(':
+            node = self.expression()
+            self.take(')')
+            return node
+        raise ExpressionError(f"Unexpected {value!r}")
+
+
+def parse(source):
+    return Parser(tokenize(source)).parse()
+
+
+def compile_node(node, backend):
+    """Turn a parsed tree into a closure that takes a dict of variables"""
+    kind = node[0]
+    if kind == 'num':
+        value = backend.number(node[1])
+        return lambda env: value
+    if kind == 'var':
+        name = node[1]
+        if name in backend.constants:
+            value = backend.constants[name]
+            return lambda env: value
+
+        def variable(env):
+            try:
+                return env[name]
+            except KeyError:
+                raise ExpressionError(f"Unknown variable {name!r}") from None
+        return variable
+    if kind == 'neg':
+        operand = compile_node(node[1], backend)
+        return lambda env: -operand(env)
+    if kind == 'bin':
+        func = backend.operators[node[1]]
+        left = compile_node(node[2], backend)
+        right = compile_node(node[3], backend)
+        # Fold constant parts once instead of on every call
+        if node[2][0] == 'num' and node[3][0] == 'num':
+            value = func(left(None), right(None))
+            return lambda env: value
+        return lambda env: func(left(env), right(env))
+    if kind == 'chain':
+        first = compile_node(node[1], backend)
+        steps = [(backend.operators[op], compile_node(operand, backend)) for op, operand in node[2]]
+
+        def chain(env):
+            value = first(env)
+            for func, operand in steps:
+                value = func(value, operand(env))
+            return value
+        if node[1][0] == 'num' and all(operand[0] == 'num' for _, operand in node[2]):
+            value = chain(None)
+            return lambda env: value
+        return chain
+    if kind == 'call':
+        func = backend.functions[node[1]]
+        args = [compile_node(arg, backend) for arg in node[2]]
+        if len(args) == 1:
+            arg = args[0]
+            return lambda env: func(arg(env))
+        return lambda env: func(*[arg(env) for arg in args])
+    raise ExpressionError(f"Unknown node {kind!r}")
+
+
+@lru_cache(maxsize=4096)
+def compile_expression(source, mode='float'):
+    """Parse and compile an expression once; later calls with the same text hit the cache.
+
+    mode is a backend name: 'float', 'decimal', 'fraction' or 'array'
+    (NumPy, see ARRAY_OPERATORS).
+    """
+    backend = get_backend(mode)
+    if mode == 'array':
+        require_numpy()
+    return compile_node(parse(source), backend)
+
+
+def evaluate(source, mode='float', **variables):
+    """Evaluate an expression, e.g. evaluate("2 * x + 1", x=3) -> 7.0"""
+    return compile_expression(source, mode)(variables)
+
+
+def interpret(node, env):
+    """Walk the tree directly without compiling (used as the benchmark baseline)"""
+    kind = node[0]
+    if kind == 'num':
+        return float(node[1])
+    if kind == 'var':
+        if node[1] in CONSTANTS:
+            return CONSTANTS[node[1]]
+        try:
+            return env[node[1]]
+        except KeyError:
+            raise ExpressionError(f"Unknown variable {node[1]!r}") from None
+    if kind == 'neg':
+        return -interpret(node[1], env)
+    if kind == 'bin':
+        return BINARY_OPERATORS[node[1]](interpret(node[2], env), interpret(node[3], env))
+    if kind == 'chain':
+        value = interpret(node[1], env)
+        for op, operand in node[2]:
+            value = BINARY_OPERATORS[op](value, interpret(operand, env))
+        return value
+    return FUNCTIONS[node[1]](*[interpret(arg, env) for arg in node[2]])
+
+
+def format_result(value):
+    if isinstance(value, Fraction) and value.denominator != 1:
+        return f"{value} (~{float(value):.15g})"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e16:
+        return str(int(value))
+    return str(value)
+
+
+def evaluate_lines(lines, mode='float'):
+    """Evaluate one expression per line, yielding one output line each.
+
+    Empty lines and lines starting with # are skipped. A bad line gives
+    an "Error: ..." line instead of stopping the batch.
+    """
+    for line in lines:
+        source = line.strip()
+        if not source or source.startswith('#'):
+            continue
+        try:
+            yield format_result(compile_expression(source, mode)({}))
+        except ZeroDivisionError:
+            yield "Error: Cannot divide by zero!"
+        except RecursionError:
+            # e.g. thousands of nested parentheses
+            yield "Error: expression too deeply nested"
+        except (ExpressionError, ArithmeticError, TypeError, ValueError) as e:
+            yield f"Error: {e}"
+
+
+def run_batch(path, mode='float'):
+    """Evaluate every line of a file ('-' for stdin) and print the results"""
+    source = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        out = sys.stdout
+        buffer = []
+        for result in evaluate_lines(source, mode):
+            buffer.append(result)
+            if len(buffer) >= 10000:
+                out.write('\n'.join(buffer) + '\n')
+                buffer.clear()
+        if buffer:
+            out.write('\n'.join(buffer) + '\n')
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+# ---------------- Array mode ----------------
+# The same operations applied elementwise to whole columns with NumPy.
+# Division by zero does not stop the run: those elements are masked
+# and come out as NaN.
+
+def require_numpy():
+    if np is None:
+        raise ExpressionError("Array mode needs NumPy (pip install numpy)")
+
+
+def array_divide(a, b):
+    """Elementwise a / b; where b is 0 the result is NaN instead of an error"""
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    result = np.full(a.shape, np.nan)
+    np.divide(a, b, out=result, where=(b != 0))
+    return result
+
+
+def array_mod(a, b):
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    result = np.full(a.shape, np.nan)
+    np.mod(a, b, out=result, where=(b != 0))
+    return result
+
+
+def array_power(a, b):
+    with np.errstate(invalid='ignore', over='ignore'):
+        return np.power(np.asarray(a, dtype=float), b)
+
+
+def array_sqrt(a):
+    with np.errstate(invalid='ignore'):
+        return np.sqrt(a)
+
+
+ARRAY_OPERATORS = {
+    '+': add,
+    '-': subtract,
+    '*': multiply,
+    '/': array_divide,
+    '%': array_mod,
+    '**': array_power,
+}
+
+ARRAY_FUNCTIONS = {
+    'abs': np.abs if np is not None else abs,
+    'sqrt': array_sqrt,
+    'min': lambda *args: np.minimum.reduce(np.broadcast_arrays(*args)),
+    'max': lambda *args: np.maximum.reduce(np.broadcast_arrays(*args)),
+    'round': lambda a, digits=0: np.round(a, int(digits)),
+}
+
+OPERATION_SYMBOLS = {'add': '+', 'subtract': '-', 'multiply': '*', 'divide': '/'}
+
+
+def column_names(header):
+    """Variable names for CSV header fields: letters, digits and _ only"""
+    names = []
+    for i, field in enumerate(header):
+        name = re.sub(r'\W', '_', field.strip())
+        if not name or name[0].isdigit():
+            name = f"c{i}"
+        names.append(name)
+    return names
+
+
+def is_data_line(line):
+    """True for CSV lines loadtxt turns into a row (not blank, not only a # comment)"""
+    return bool(line.split(b'#' if isinstance(line, bytes) else '#', 1)[0].strip())
+
+
+def iter_csv_chunks(path, chunk_rows):
+    """Yield (names, 2-D float array) chunks of a CSV file with a header row"""
+    with open(path, 'r', encoding='utf-8') as f:
+        header = f.readline().rstrip('\r\n').split(',')
+        names = column_names(header)
+        while True:
+            lines = list(itertools.islice(f, chunk_rows))
+            if not lines:
+                break
+            lines = [line for line in lines if is_data_line(line)]
+            if lines:
+                yield names, np.loadtxt(lines, delimiter=',', ndmin=2, dtype=float)
+
+
+def iter_npy_chunks(path, chunk_rows):
+    """Yield (names, 2-D array) chunks of a .npy file, memory-mapped so it is never loaded whole"""
+    data = np.load(path, mmap_mode='r')
+    if data.ndim == 1:
+        data = data.reshape(-1, 1)
+    names = [f"c{i}" for i in range(data.shape[1])]
+    for start in range(0, data.shape[0], chunk_rows):
+        yield names, np.asarray(data[start:start + chunk_rows], dtype=float)
+
+
+def evaluate_array(expression, names, block):
+    """Evaluate a compiled expression on one block; columns are c0, c1, ... and their header names"""
+    env = {}
+    for i, name in enumerate(names):
+        env[f"c{i}"] = env[name] = block[:, i]
+    result = compile_expression(expression, 'array')(env)
+    return np.broadcast_to(np.asarray(result, dtype=float), (block.shape[0],))
+
+
+def count_rows(path):
+    if path.lower().endswith('.npy'):
+        return np.load(path, mmap_mode='r').shape[0]
+    with open(path, 'rb') as f:
+        f.readline()  # header
+        return sum(1 for line in f if is_data_line(line))
+
+
+def run_array(input_path, output_path, expression, chunk_rows=100000):
+    """Evaluate expression for every row of a CSV/NPY file and write the results.
+
+    The input is read chunk_rows at a time and every chunk is written
+    out in one go, so files larger than memory work too. Output is a
+    .npy file (written through a memory map) or a one-column CSV.
+    Returns (rows, invalid) where invalid counts NaN results, e.g.
+    divisions by zero.
+    """
+    require_numpy()
+    compile_expression(expression, 'array')  # report syntax errors before reading anything
+    is_npy = input_path.lower().endswith('.npy')
+    chunks = iter_npy_chunks(input_path, chunk_rows) if is_npy else iter_csv_chunks(input_path, chunk_rows)
+
+    rows = 0
+    invalid = 0
+    if output_path.lower().endswith('.npy'):
+        out = np.lib.format.open_memmap(output_path, mode='w+', dtype=float, shape=(count_rows(input_path),))
+        for names, block in chunks:
+            result = evaluate_array(expression, names, block)
+            out[rows:rows + len(result)] = result
+            rows += len(result)
+            invalid += int(np.count_nonzero(np.isnan(result)))
+        out.flush()
+        del out
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("result\n")
+            for names, block in chunks:
+                result = evaluate_array(expression, names, block)
+                np.savetxt(f, result, fmt='%.17g')
+                rows += len(result)
+                invalid += int(np.count_nonzero(np.isnan(result)))
+    return rows, invalid
+
+
+# ---------------- Numeric backends ----------------
+# The same operations over different number types. float is fastest,
+# Decimal gives exact decimal arithmetic up to the context precision
+# (what money needs), Fraction is exact for any rational result.
+
+class Backend:
+    """Number type plus the operators and functions compiled expressions use"""
+
+    def __init__(self, name, number, operators=BINARY_OPERATORS, functions=FUNCTIONS):
+        self.name = name
+        self.number = number  # converts number text like "1.25" to this type
+        self.operators = operators
+        self.functions = functions
+        self.constants = {key: number(repr(value)) for key, value in CONSTANTS.items()}
+
+
+def decimal_sqrt(a):
+    return Decimal(a).sqrt()
+
+
+def decimal_mod(a, b):
+    """Floor modulo like float and Fraction: -7 % 3 == 2 (Decimal's own % gives -1)"""
+    result = a % b
+    if not result:
+        return result.copy_abs()  # 0, not -0, for -6 % 3
+    if (result < 0) != (b < 0):
+        result += b
+    return result
+
+
+def fraction_sqrt(a):
+    """Exact square root, only for perfect squares"""
+    a = Fraction(a)
+    if a >= 0:
+        num, den = math.isqrt(a.numerator), math.isqrt(a.denominator)
+        if num * num == a.numerator and den * den == a.denominator:
+            return Fraction(num, den)
+    raise ExpressionError(f"sqrt({a}) is not an exact fraction")
+
+
+# Exact numbers grow without bound (10 ** 10 ** 9 would run for hours), so
+# they are capped at what str() can print (4300 digits unless changed with
+# sys.set_int_max_str_digits)
+MAX_FRACTION_DIGITS = getattr(sys, 'get_int_max_str_digits', lambda: 0)() or 300000
+LITERAL_EXPONENT = re.compile(r'[eE]([+-]?\d+)$')
+
+
+def fraction_number(text):
+    """Fraction from number text, refusing exponents too large to print ("1e9999999")"""
+    match = LITERAL_EXPONENT.search(text)
+    if match and abs(int(match.group(1))) >= MAX_FRACTION_DIGITS:
+        raise ExpressionError(f"{text} is too large for the fraction backend")
+    return Fraction(text)
+
+
+def fraction_power(a, b):
+    """Powers stay exact only for whole exponents"""
+    a, b = Fraction(a), Fraction(b)
+    if b.denominator != 1:
+        raise ExpressionError("Fraction backend only supports whole-number exponents")
+    if abs(a) not in (0, 1):
+        digits = abs(b.numerator) * math.log10(max(abs(a.numerator), a.denominator))
+        if digits >= MAX_FRACTION_DIGITS:  # the result has int(digits) + 1 digits
+            raise ExpressionError(f"Exponent {b} is too large for the fraction backend")
+    return a ** b.numerator
+
+
+DECIMAL_OPERATORS = dict(BINARY_OPERATORS, **{'%': decimal_mod})
+DECIMAL_FUNCTIONS = dict(FUNCTIONS, sqrt=decimal_sqrt)
+FRACTION_OPERATORS = dict(BINARY_OPERATORS, **{'**': fraction_power})
+FRACTION_FUNCTIONS = dict(FUNCTIONS, sqrt=fraction_sqrt)
+
+BACKENDS = {
+    'float': Backend('float', float),
+    'decimal': Backend('decimal', Decimal, DECIMAL_OPERATORS, DECIMAL_FUNCTIONS),
+    'fraction': Backend('fraction', fraction_number, FRACTION_OPERATORS, FRACTION_FUNCTIONS),
+    'array': Backend('array', float, ARRAY_OPERATORS, ARRAY_FUNCTIONS),
+}
+
+
+def get_backend(name):
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ExpressionError(f"Unknown backend {name!r}") from None
+
+
+def read_number(text, mode='float'):
+    """Parse user input with the backend's number type; ValueError if invalid"""
+    try:
+        return get_backend(mode).number(text.strip())
+    except (ValueError, ArithmeticError):
+        raise ValueError(f"invalid number: {text!r}") from None
+
+
+def set_decimal_context(precision=28, rounding=decimal.ROUND_HALF_EVEN):
+    """Configure Decimal arithmetic for this thread (significant digits and rounding)"""
+    context = decimal.getcontext()
+    context.prec = precision
+    context.rounding = rounding
+    # Constant parts are folded at compile time with the old context
+    compile_expression.cache_clear()
+
+
+def main(mode='float'):
+    while True:
+        print("\nSelect operations: ")  
+        print("1. Add")
+        print("2. Subtract")
+        print("3. Multiply")
+        print("4. Divide")
+        print("5. Evaluate expression")
+        print("6. Exit")
+
+        choice = input("Enter choice (1-6): ")  
+
+        if choice == '6':
+            print("See ya!")
+            break
+
+        if choice == '5':
+            expression = input("Enter expression (e.g. 2 * (3 + 4) ** 2): ")
+            for result in evaluate_lines([expression], mode):
+                print(result if result.startswith("Error") else f"Result: {expression.strip()} = {result}")
+            continue
+
+        if choice in ['1', '2', '3', '4']:
+            try:  
+                num1 = read_number(input("Enter first number: "), mode)  
+                num2 = read_number(input("Enter second number: "), mode)  
+
+                if choice == '1':
+                    result = add(num1, num2)
+                    print(f"Result: {num1} + {num2} = {result}")  
+
+                elif choice == '2':
+                    result = subtract(num1, num2)
+                    print(f"Result: {num1} - {num2} = {result}")  
+
+                elif choice == '3':
+                    result = multiply(num1, num2)
+                    print(f"Result: {num1} * {num2} = {result}")  
+
+                elif choice == '4':
+                    if num2 != 0:
+                        result = divide(num1, num2)
+                        print(f"Result: {num1} / {num2} = {result}")  
+                    else:
+                        print("Error: Cannot divide by zero!") 
+            
+            except ValueError:  
+                print("Error: Please enter valid numbers!")
         
-        except ValueError:  
-            print("Error: Please enter valid numbers!")
-    
+        else:
+            print("Invalid choice! Please try again.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simple calculator")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="evaluate one expression per line from FILE ('-' for stdin) and exit")
+    parser.add_argument('--array', metavar='INPUT',
+                        help="array mode: CSV (with header) or .npy file whose columns are the inputs")
+    parser.add_argument('--expr', help="expression over the columns, e.g. 'price * qty' or 'c0 / c1'")
+    parser.add_argument('--op', choices=sorted(OPERATION_SYMBOLS),
+                        help="shortcut for the first two columns, e.g. --op divide means 'c0 / c1'")
+    parser.add_argument('--out', help="output file (.npy or .csv) for array mode")
+    parser.add_argument('--chunk-rows', type=int, default=100000, help="rows processed at a time")
+    parser.add_argument('--backend', choices=['float', 'decimal', 'fraction'], default='float',
+                        help="number type for the menu and --batch (default: float)")
+    parser.add_argument('--precision', type=int, default=28, help="significant digits for --backend decimal")
+    parser.add_argument('--rounding', default='ROUND_HALF_EVEN',
+                        choices=[name for name in dir(decimal) if name.startswith('ROUND_')],
+                        help="rounding mode for --backend decimal")
+    args = parser.parse_args()
+    if args.backend == 'decimal':
+        set_decimal_context(args.precision, getattr(decimal, args.rounding))
+    if args.array:
+        expression = args.expr or (f"c0 {OPERATION_SYMBOLS[args.op]} c1" if args.op else None)
+        if not expression or not args.out:
+            parser.error("--array needs --out and either --expr or --op")
+        try:
+            rows, invalid = run_array(args.array, args.out, expression, args.chunk_rows)
+        except (ExpressionError, OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"{rows} rows written to {args.out}" + (f" ({invalid} NaN, e.g. division by zero)" if invalid else ""))
+    elif args.batch:
+        run_batch(args.batch, args.backend)
     else:
-        print("Invalid choice! Please try again.")
\ No newline at end of file
+        main(args.backend)
@@ -0,0 +1,166 @@
+"""
+Load generator for the chatbot server (Task-8_chatbot.py --serve)
+
+Opens N concurrent sessions, each one sending a message and waiting for
+the reply in a loop, and prints messages per second and p50/p99/p99.9
+reply latency for every session count.
+
+Examples:
+    # start a server and step through 100, 1000 and 5000 sessions
+    python chatbot_loadtest.py --sessions 100,1000,5000 --duration 10
+
+    # against a server that is already running, with 0.5s think time
+    python chatbot_loadtest.py --port 8766 --no-server --think 0.5
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Task-8_chatbot.py')
+INTENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'intents.json')
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def wait_for_port(host, port, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def load_messages():
+    """Patterns from intents.json, the same with a typo, and some nonsense (no goodbyes)"""
+    with open(INTENTS_FILE, 'r', encoding='utf-8') as file:
+        intents = json.load(file)['intents']
+    patterns = [pattern for intent in intents if not intent.get('end') for pattern in intent['patterns']]
+    typos = [pattern[:-1] for pattern in patterns if len(pattern) > 4]
+    return patterns + typos + ['what is the weather like', 'tell me a joke', 'asdf qwerty']
+
+
+async def session(host, port, messages, deadline, think, latencies, counters, connect_limit):
+    rng = random.Random()
+    try:
+        async with connect_limit:
+            reader, writer = await asyncio.open_connection(host, port)
+        greeting = await reader.readline()
+    except OSError:
+        counters['failed'] += 1
+        return
+    if not greeting.startswith(b"Flash: Hello"):
+        counters['rejected'] += 1
+        writer.close()
+        return
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            writer.write(rng.choice(messages).encode('utf-8') + b"\n")
+            await writer.drain()
+            if not await reader.readline():
+                counters['dropped'] += 1
+                return
+            latencies.append(time.perf_counter() - started)
+            if think:
+                await asyncio.sleep(rng.expovariate(1 / think))
+        writer.write(b"bye\n")
+        await writer.drain()
+        await reader.readline()
+    except OSError:
+        counters['dropped'] += 1
+    finally:
+        writer.close()
+
+
+async def run_level(host, port, sessions, duration, think, messages):
+    latencies = []
+    counters = {'failed': 0, 'rejected': 0, 'dropped': 0}
+    connect_limit = asyncio.Semaphore(200)  # do not flood the listen backlog
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        session(host, port, messages, deadline, think, latencies, counters, connect_limit)
+        for _ in range(sessions)
+    ))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        'messages': len(latencies),
+        'rate': len(latencies) / elapsed,
+        'p50': percentile(latencies, 50) * 1000,
+        'p99': percentile(latencies, 99) * 1000,
+        'p999': percentile(latencies, 99.9) * 1000,
+        **counters,
+    }
+
+
+def raise_file_limit(needed):
+    """Each session is a socket; ask for enough file descriptors where we can"""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the chatbot server")
+    parser.add_argument('--sessions', default='100,1000,5000', help="comma-separated session counts")
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds per session count")
+    parser.add_argument('--think', type=float, default=0.0, help="mean seconds between a session's messages")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help="server port (default: start a server on a free port)")
+    parser.add_argument('--no-server', action='store_true', help="do not start a server, use --host/--port")
+    args = parser.parse_args()
+
+    levels = [int(count) for count in args.sessions.split(',')]
+    raise_file_limit(max(levels) + 100)
+    messages = load_messages()
+    port = args.port or free_port()
+
+    server = None
+    if not args.no_server:
+        server = subprocess.Popen(
+            [sys.executable, APP_FILE, '--serve', '--port', str(port), '--max-sessions', str(max(levels) + 100)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if not wait_for_port(args.host, port):
+            print("Server did not start")
+            return
+        print(f"{'sessions':>9}{'messages':>10}{'msgs/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'p99.9 ms':>10}"
+              f"{'failed':>8}{'rejected':>10}{'dropped':>9}")
+        for sessions in levels:
+            r = asyncio.run(run_level(args.host, port, sessions, args.duration, args.think, messages))
+            print(f"{sessions:>9}{r['messages']:>10}{r['rate']:>10.0f}{r['p50']:>9.2f}{r['p99']:>9.2f}"
+                  f"{r['p999']:>10.2f}{r['failed']:>8}{r['rejected']:>10}{r['dropped']:>9}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+if __name__ == '__main__':
+    main()
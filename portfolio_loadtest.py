@@ -0,0 +1,198 @@
+"""
+Load test for the Flask portfolio (Flask-portfolio_task6.py)
+
+Drives GET / and POST /contact with many concurrent keep-alive clients
+and prints p50/p99 latency and requests per second for each endpoint.
+
+Examples:
+    # against a server that is already running (start it with CONTACT_RATE_LIMIT=0)
+    python portfolio_loadtest.py --url http://127.0.0.1:5000
+
+    # start each server configuration in turn and compare them
+    python portfolio_loadtest.py --config "dev" --config "threaded" \
+        --config "waitress --threads 16" --config "gunicorn --workers 4 --threads 4"
+"""
+import argparse
+import http.client
+import itertools
+import os
+import shlex
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlencode, urlparse
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Flask-portfolio_task6.py')
+
+# Unique message numbers, so the duplicate filter does not short-circuit the test
+_message_numbers = itertools.count()
+
+
+def contact_body():
+    return urlencode({
+        'name': 'Load Test',
+        'email': 'loadtest@example.com',
+        'message': f'Hello from the load test! #{next(_message_numbers)}',
+    })
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def client_worker(host, port, method, path, deadline, latencies, errors):
+    """One client: sends requests over a keep-alive connection until the deadline"""
+    conn = None
+    while time.perf_counter() < deadline:
+        if conn is None:
+            conn = http.client.HTTPConnection(host, port, timeout=10)
+        headers = {}
+        body = None
+        if method == 'POST':
+            body = contact_body()
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status >= 400:
+                errors.append(response.status)
+            if response.getheader('Connection', '').lower() == 'close':
+                conn.close()
+                conn = None
+        except (OSError, http.client.HTTPException):
+            errors.append('connection')
+            if conn is not None:
+                conn.close()
+            conn = None
+            continue
+        latencies.append(time.perf_counter() - start)
+
+    if conn is not None:
+        conn.close()
+
+
+def run_endpoint(host, port, method, path, clients, duration):
+    """Run one endpoint with `clients` concurrent connections, return stats"""
+    latencies = []
+    errors = []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=client_worker, args=(host, port, method, path, deadline, latencies, errors))
+        for _ in range(clients)
+    ]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+
+def wait_for_port(host, port, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(config, port, workdir):
+    """Start the portfolio app with the given server arguments, e.g. "waitress --threads 16" """
+    args = shlex.split(config)
+    cmd = [sys.executable, APP_FILE, '--server', args[0], '--port', str(port)] + args[1:]
+    # Rate limiting is turned off, otherwise every client gets 429 after a few posts
+    env = dict(os.environ, MESSAGES_FILE=os.path.join(workdir, 'messages.jsonl'), CONTACT_RATE_LIMIT='0')
+    # Own process group so the dev server's reloader child is stopped too
+    return subprocess.Popen(cmd, env=env, cwd=workdir, start_new_session=(os.name == 'posix'),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def stop_server(server):
+    if os.name == 'posix':
+        import signal
+        try:
+            os.killpg(server.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    else:
+        server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+def print_results(name, results):
+    print(f"\n=== {name} ===")
+    print(f"{'endpoint':<16}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for endpoint, r in results.items():
+        print(f"{endpoint:<16}{r['requests']:>10}{r['errors']:>8}{r['rps']:>10.1f}"
+              f"{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}")
+
+
+def run_all(host, port, clients, duration):
+    return {
+        'GET /': run_endpoint(host, port, 'GET', '/', clients, duration),
+        'POST /contact': run_endpoint(host, port, 'POST', '/contact', clients, duration),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the portfolio website")
+    parser.add_argument('--url', default='http://127.0.0.1:5000',
+                        help="server to test when no --config is given")
+    parser.add_argument('--config', action='append', default=[],
+                        help="server configuration to start and test, e.g. \"waitress --threads 16\" (repeatable)")
+    parser.add_argument('--clients', type=int, default=32, help="concurrent connections")
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds per endpoint")
+    args = parser.parse_args()
+
+    if not args.config:
+        url = urlparse(args.url)
+        host, port = url.hostname, url.port or 80
+        print_results(args.url, run_all(host, port, args.clients, args.duration))
+        return
+
+    for config in args.config:
+        port = free_port()
+        with tempfile.TemporaryDirectory() as workdir:
+            server = start_server(config, port, workdir)
+            try:
+                if not wait_for_port('127.0.0.1', port):
+                    print(f"\n=== {config} ===\nServer did not start")
+                    continue
+                print_results(config, run_all('127.0.0.1', port, args.clients, args.duration))
+            finally:
+                stop_server(server)
+
+
+if __name__ == '__main__':
+    main()
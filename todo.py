@@ -1,58 +1,434 @@
 # Simple To-Do List Application
 
-tasks = []
+import argparse
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
 
-def load_tasks():
-    """Load tasks from file"""
+DB_FILE = os.environ.get("TODO_DB", "tasks.db")
+LEGACY_FILE = "tasks.txt"
+PAGE_SIZE = 20
+MAX_ID = 2 ** 63 - 1  # largest INTEGER SQLite stores
+WRITE_TIMEOUT = 30  # seconds a request waits for the writer thread
+NEXT_COUNT = 5  # tasks shown per section of "Next Tasks"
+
+SCHEMA_VERSION = 4
+COLUMNS = "id, text, priority, due, tags, version"
+
+WORD = re.compile(r"\w+")
+LAST_CHAR = "\U0010ffff"  # every word starting with p sorts between p and p + LAST_CHAR
+ESTIMATE_LIMIT = 1000  # index entries counted per search word; fewer means a rare word
+
+
+def tokenize(text):
+    """Distinct lowercase words of a task, as stored in the search index"""
+    return set(WORD.findall(text.lower()))
+
+
+@dataclass
+class Task:
+    """One task. priority 1 is the most urgent; None means no priority/no due date.
+
+    version goes up by one on every change, so a client can tell whether
+    the task it read is still current (optimistic concurrency).
+    """
+    __slots__ = ("id", "text", "priority", "due", "tags", "version")
+    id: int
+    text: str
+    priority: int
+    due: date
+    tags: tuple
+    version: int
+
+    def __str__(self):
+        """The task in tasks.txt form, e.g. "Pay rent !1 due:2024-06-01 #home" """
+        parts = [self.text]
+        if self.priority is not None:
+            parts.append(f"!{self.priority}")
+        if self.due is not None:
+            parts.append(f"due:{self.due.isoformat()}")
+        parts.extend(f"#{tag}" for tag in self.tags)
+        return " ".join(parts)
+
+    def words(self):
+        """Words the search index stores for this task (text and tags)"""
+        return tokenize(self.text) | set(self.tags)
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "text": self.text,
+            "priority": self.priority,
+            "due": self.due.isoformat() if self.due else None,
+            "tags": list(self.tags),
+            "version": self.version,
+            "line": str(self),
+        }
+
+    @classmethod
+    def from_row(cls, row):
+        task_id, text, priority, due, tags, version = row
+        return cls(task_id, text, priority, date.fromisoformat(due) if due else None,
+                   tuple(tags.split()), version)
+
+
+class VersionConflict(Exception):
+    """The task was changed by someone else since the given version was read"""
+
+    def __init__(self, current):
+        super().__init__(f"task #{current.id} is at version {current.version}")
+        self.current = current
+
+
+PRIORITY = re.compile(r"!([1-9])")
+TAG = re.compile(r"#(\w+)")
+
+
+def parse_due(value, today=None):
+    """due: value -> date, accepting YYYY-MM-DD, "today" and "tomorrow" (None if invalid)"""
+    today = today or date.today()
+    value = value.lower()
+    if value == "today":
+        return today
+    if value == "tomorrow":
+        return today + timedelta(days=1)
     try:
-        with open("tasks.txt", "r") as file:
-            for line in file:
-                task = line.strip()
-                if task:
-                    tasks.append(task)
-        print(f"Loaded {len(tasks)} tasks")
-    except FileNotFoundError:
-        print("No previous tasks found. Starting fresh!")
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
 
-def save_tasks():
-    """Save tasks to file"""
-    with open("tasks.txt", "w") as file:
-        for task in tasks:
-            file.write(task + "\n")
+
+def parse_task(line, today=None):
+    """Read a tasks.txt line, taking "!1", "due:2024-06-01" and "#tag" words out of the text.
+
+    Plain lines without any of these are just the text, as before.
+    """
+    words, priority, due, tags = [], None, None, []
+    for word in line.split():
+        if PRIORITY.fullmatch(word):
+            priority = int(word[1:])
+        elif word.lower().startswith("due:") and parse_due(word[4:], today):
+            due = parse_due(word[4:], today)
+        elif TAG.fullmatch(word):
+            if word[1:].lower() not in tags:
+                tags.append(word[1:].lower())
+        else:
+            words.append(word)
+    return Task(None, " ".join(words), priority, due, tuple(tags), None)
+
+
+class TaskStore:
+    """Tasks kept in SQLite, so adding or removing one only touches that row.
+
+    Every task has a stable ID (it does not shift when others are removed),
+    and nothing is read until it is asked for - views page through the
+    table by ID instead of loading the whole list.
+
+    The terms table is an inverted index (word -> task IDs) kept up to
+    date on every add and remove, so search() never scans the tasks.
+    Due dates and priorities have their own sorted indexes, so the "next"
+    queries read only the rows they return.
+    """
+
+    def __init__(self, path=DB_FILE, legacy_file=LEGACY_FILE):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        # WAL: a commit appends to the log instead of rewriting pages in place
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.migrated = 0
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            self._create(legacy_file)
+        if version < 2:
+            self._create_index()
+        if version < 3:
+            self._add_schedule()
+        if version < 4:
+            with self.db:
+                self.db.execute("ALTER TABLE tasks ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+                self.db.execute("PRAGMA user_version=4")
+        if version < 5:
+            with self.db:
+                # task -> words, so search() can check a candidate for a word with one lookup
+                self.db.execute("CREATE INDEX IF NOT EXISTS terms_by_task ON terms (task_id, token)")
+                self.db.execute("PRAGMA user_version=5")
+
+    def _create(self, legacy_file):
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " text TEXT NOT NULL)"
+            )
+            # Import the old tasks.txt once, in its original order
+            if legacy_file and os.path.exists(legacy_file):
+                with open(legacy_file, "r", encoding="utf-8") as file:
+                    rows = ((line.strip(),) for line in file if line.strip())
+                    cursor = self.db.executemany("INSERT INTO tasks (text) VALUES (?)", rows)
+                    self.migrated = cursor.rowcount
+            self.db.execute("PRAGMA user_version=1")
+
+    def _create_index(self):
+        with self.db:
+            # (token, task_id) is the primary key, so a word or prefix lookup
+            # is a range scan that returns its task IDs already sorted
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS terms ("
+                " token TEXT NOT NULL,"
+                " task_id INTEGER NOT NULL,"
+                " PRIMARY KEY (token, task_id)) WITHOUT ROWID"
+            )
+            for task_id, text in self.db.execute("SELECT id, text FROM tasks").fetchall():
+                self._index(task_id, tokenize(text))
+            self.db.execute("PRAGMA user_version=2")
+
+    def _add_schedule(self):
+        with self.db:
+            self.db.execute("ALTER TABLE tasks ADD COLUMN priority INTEGER")
+            self.db.execute("ALTER TABLE tasks ADD COLUMN due TEXT")  # YYYY-MM-DD sorts as a date
+            self.db.execute("ALTER TABLE tasks ADD COLUMN tags TEXT NOT NULL DEFAULT ''")
+            self.db.execute("CREATE INDEX tasks_due ON tasks (due, id) WHERE due IS NOT NULL")
+            self.db.execute("CREATE INDEX tasks_priority ON tasks (priority, id) WHERE priority IS NOT NULL")
+            # Lines imported from tasks.txt may already carry !1 / due: / #tag
+            for task_id, text in self.db.execute("SELECT id, text FROM tasks").fetchall():
+                task = parse_task(text)
+                if task.text == text:
+                    continue
+                self._unindex(task_id, tokenize(text))
+                self.db.execute("UPDATE tasks SET text = ?, priority = ?, due = ?, tags = ? WHERE id = ?",
+                                self._values(task) + (task_id,))
+                self._index(task_id, task.words())
+            self.db.execute("PRAGMA user_version=3")
+
+    def _index(self, task_id, words):
+        self.db.executemany("INSERT OR IGNORE INTO terms (token, task_id) VALUES (?, ?)",
+                            ((token, task_id) for token in words))
+
+    def _unindex(self, task_id, words):
+        self.db.executemany("DELETE FROM terms WHERE token = ? AND task_id = ?",
+                            ((token, task_id) for token in words))
+
+    @staticmethod
+    def _values(task):
+        return (task.text, task.priority, task.due.isoformat() if task.due else None, " ".join(task.tags))
+
+    # add/update/remove commit on their own. The _add/_update/_remove versions
+    # leave that to the caller, so the server's writer can batch them.
+
+    def add(self, task):
+        """Store a Task (or a line like "Pay rent !1 due:2024-06-01 #home") and return its ID"""
+        with self.db:
+            return self._add(task)
+
+    def update(self, task_id, task, version=None):
+        """Replace a task's text and fields, returning the new Task (None if there is no such task).
+
+        With a version, raise VersionConflict unless the task is still at it.
+        """
+        with self.db:
+            return self._update(task_id, task, version)
+
+    def remove(self, task_id, version=None):
+        """Delete a task by ID, returning it (None if there is no such task)"""
+        with self.db:
+            return self._remove(task_id, version)
+
+    def _current(self, task_id, version):
+        task = self.get(task_id)
+        if task is not None and version is not None and task.version != version:
+            raise VersionConflict(task)
+        return task
+
+    def _add(self, task):
+        if isinstance(task, str):
+            task = parse_task(task)
+        task_id = self.db.execute("INSERT INTO tasks (text, priority, due, tags) VALUES (?, ?, ?, ?)",
+                                  self._values(task)).lastrowid
+        self._index(task_id, task.words())
+        return task_id
+
+    def _update(self, task_id, task, version=None):
+        if isinstance(task, str):
+            task = parse_task(task)
+        old = self._current(task_id, version)
+        if old is None:
+            return None
+        self.db.execute("UPDATE tasks SET text = ?, priority = ?, due = ?, tags = ?, version = version + 1"
+                        " WHERE id = ?", self._values(task) + (task_id,))
+        old_words, new_words = old.words(), task.words()
+        self._unindex(task_id, old_words - new_words)
+        self._index(task_id, new_words - old_words)
+        return Task(task_id, task.text, task.priority, task.due, task.tags, old.version + 1)
+
+    def _remove(self, task_id, version=None):
+        task = self._current(task_id, version)
+        if task is not None:
+            self.db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            self._unindex(task_id, task.words())
+        return task
+
+    def get(self, task_id):
+        row = self.db.execute(f"SELECT {COLUMNS} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return Task.from_row(row) if row else None
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def is_empty(self):
+        """True if there are no tasks; reads one row at most, unlike count()"""
+        return self.db.execute("SELECT 1 FROM tasks LIMIT 1").fetchone() is None
+
+    def _select(self, where, params, order="id", limit=PAGE_SIZE):
+        rows = self.db.execute(f"SELECT {COLUMNS} FROM tasks WHERE {where} ORDER BY {order} LIMIT ?",
+                               tuple(params) + (limit,))
+        return [Task.from_row(row) for row in rows]
+
+    def page(self, after_id=0, limit=PAGE_SIZE):
+        """Up to `limit` tasks with IDs above `after_id`"""
+        return self._select("id > ?", (after_id,), limit=limit)
+
+    def overdue(self, today=None, limit=NEXT_COUNT):
+        """Tasks whose due date has passed, oldest first"""
+        today = today or date.today()
+        return self._select("due IS NOT NULL AND due < ?", (today.isoformat(),), "due, id", limit)
+
+    def next_due(self, today=None, limit=NEXT_COUNT):
+        """Tasks due today or later, soonest first"""
+        today = today or date.today()
+        return self._select("due IS NOT NULL AND due >= ?", (today.isoformat(),), "due, id", limit)
+
+    def top_priority(self, limit=NEXT_COUNT):
+        """Tasks with a priority, most urgent (!1) first"""
+        return self._select("priority IS NOT NULL", (), "priority, id", limit)
+
+    def estimate_matches(self, prefix):
+        """Index entries for a search word, counted no further than ESTIMATE_LIMIT"""
+        return self.db.execute(
+            "SELECT count(*) FROM (SELECT 1 FROM terms WHERE token >= ? AND token < ? LIMIT ?)",
+            (prefix, prefix + LAST_CHAR, ESTIMATE_LIMIT),
+        ).fetchone()[0]
+
+    def search(self, query, after_id=0, limit=PAGE_SIZE):
+        """Tasks containing every word of the query, each one as a prefix.
+
+        "mil bu" matches "Buy milk", and tags are searchable words too.
+        Returns up to `limit` tasks with IDs above `after_id`, like page().
+        """
+        # The rarest search word gives the candidate IDs and every other word
+        # is one terms_by_task lookup per candidate, all inside SQLite; only
+        # the final page is loaded
+        estimates = {term: self.estimate_matches(term) for term in tokenize(query)}
+        terms = sorted(estimates, key=estimates.get)
+        if not terms or not estimates[terms[0]]:
+            return []
+        entries = estimates[terms[0]]
+        # A rare word: read its few IDs from the terms range and sort them
+        # ("+" keeps SQLite off terms_by_task). A common one: walk
+        # terms_by_task in ID order, which stops as soon as the page is full.
+        order = "+task_id" if entries < ESTIMATE_LIMIT else "task_id"
+        checks = "".join(" AND EXISTS (SELECT 1 FROM terms WHERE task_id = t.task_id AND token >= ? AND token < ?)"
+                         for _ in terms[1:])
+        ids = (f"SELECT DISTINCT task_id FROM terms AS t WHERE token >= ? AND token < ? AND task_id > ?{checks}"
+               f" ORDER BY {order} LIMIT ?")
+        params = [terms[0], terms[0] + LAST_CHAR, after_id]
+        for term in terms[1:]:
+            params += [term, term + LAST_CHAR]
+        return self._select(f"id IN ({ids})", params + [limit], limit=limit)
+
+    def close(self):
+        self.db.close()
+
+
+store = None
+
+
+def load_tasks(path=DB_FILE):
+    """Open the task database (importing tasks.txt the first time)"""
+    global store
+    store = TaskStore(path)
+    if store.migrated:
+        print(f"Imported {store.migrated} tasks from {LEGACY_FILE}")
+    if store.is_empty():
+        print("No previous tasks found. Starting fresh!")
+    else:
+        print("Tasks loaded")
 
 def add_task():
     """Add a new task"""
-    task = input("Enter a new task: ")
-    if task:
-        tasks.append(task)
-        save_tasks()
-        print("Task added!")
+    task = parse_task(input("Enter a new task (optional: !1-!9 priority, due:YYYY-MM-DD, #tag): "))
+    if task.text:
+        task_id = store.add(task)
+        print(f"Task added! (#{task_id})")
     else:
         print("Task cannot be empty!")
 
-def view_tasks():
-    """Display all tasks"""
+def print_pages(title, fetch):
+    """Print tasks from fetch(after_id) a page at a time; False if there were none"""
+    tasks = fetch(0)
     if not tasks:
+        return False
+
+    print(f"\n--- {title} ---")
+    while tasks:
+        for task in tasks:
+            print(f"#{task.id}. {task}")
+        tasks = fetch(tasks[-1].id)
+        if tasks and input("-- Enter for more, q to stop: ").strip().lower() == "q":
+            break
+    print("-" * 25)
+    return True
+
+def view_tasks():
+    """Display tasks a page at a time"""
+    if not print_pages("YOUR TO-DO LIST", store.page):
         print("No tasks found!")
+
+def search_tasks():
+    """Find tasks by words or word beginnings"""
+    query = input("Search for: ").strip()
+    if not tokenize(query):
+        print("Search cannot be empty!")
+        return
+    if not print_pages(f"RESULTS FOR '{query}'", lambda after_id: store.search(query, after_id)):
+        print("No matching tasks!")
+
+def next_tasks():
+    """Show overdue tasks, what is due next and the most urgent ones"""
+    today = date.today()
+    sections = [
+        ("OVERDUE", store.overdue(today)),
+        ("DUE NEXT", store.next_due(today)),
+        ("TOP PRIORITY", store.top_priority()),
+    ]
+    if not any(tasks for _, tasks in sections):
+        print("No tasks with a due date or priority!")
         return
-    
-    print("\n--- YOUR TO-DO LIST ---")
-    for i, task in enumerate(tasks, 1):
-        print(f"{i}. {task}")
+    for title, tasks in sections:
+        if tasks:
+            print(f"\n--- {title} ---")
+            for task in tasks:
+                print(f"#{task.id}. {task}")
     print("-" * 25)
 
 def remove_task():
     """Remove a task"""
-    if not tasks:
+    if store.is_empty():
         print("No tasks to remove!")
         return
-    
-    view_tasks()
+
     try:
-        task_num = int(input("Enter task number to remove: "))
-        if 1 <= task_num <= len(tasks):
-            removed = tasks.pop(task_num - 1)
-            save_tasks()
+        task_id = check_id(int(input("Enter task number to remove (see View Tasks): ").lstrip("#")), "Task number")
+        removed = store.remove(task_id)
+        if removed is not None:
             print(f"Removed: {removed}")
         else:
             print("Invalid task number!")
@@ -63,19 +439,21 @@ def show_menu():
     """Display menu options"""
     print("\n=== TO-DO LIST MANAGER ===")
     print("1. Add Task")
-    print("2. View Tasks") 
+    print("2. View Tasks")
     print("3. Remove Task")
-    print("4. Exit")
+    print("4. Search Tasks")
+    print("5. Next Tasks")
+    print("6. Exit")
 
-def main():
+def main(path=DB_FILE):
     """Main program"""
     print("Welcome to Simple To-Do List!")
-    load_tasks()
-    
+    load_tasks(path)
+
     while True:
         show_menu()
-        choice = input("Choose option (1-4): ")
-        
+        choice = input("Choose option (1-6): ")
+
         if choice == "1":
             add_task()
         elif choice == "2":
@@ -83,11 +461,279 @@ def main():
         elif choice == "3":
             remove_task()
         elif choice == "4":
+            search_tasks()
+        elif choice == "5":
+            next_tasks()
+        elif choice == "6":
+            store.close()
             print("Goodbye!")
             break
         else:
-            print("Invalid choice! Please choose 1-4.")
+            print("Invalid choice! Please choose 1-6.")
+
+# ---------------- Server mode ----------------
+# A small JSON API so several people can share one list:
+#
+#   GET    /tasks?after=0&limit=20     page through tasks ("q=milk" searches)
+#   GET    /tasks/next                 overdue, due next and top priority
+#   GET    /tasks/<id>                 one task, ETag is its version
+#   POST   /tasks     {"text": ...}    add ("Pay rent !1 due:2024-06-01 #home")
+#   PUT    /tasks/<id> {"text": ...}   replace; If-Match: <version> -> 412 if it changed
+#   DELETE /tasks/<id>                 remove; If-Match as for PUT
+#
+# Reads use one SQLite connection per handler thread (WAL lets them run
+# next to the writer). All changes go through TaskWriter.
+
+def check_id(value, name):
+    if abs(value) > MAX_ID:
+        raise ValueError(f"{name} is too large")
+    return value
+
+
+class TaskWriter:
+    """Applies every change on one thread with one connection.
+
+    Handlers queue an operation and wait for its result. The writer takes
+    everything that is waiting and applies it in a single transaction
+    (group commit), so under load many changes share one commit.
+    """
+
+    def __init__(self, path, batch_size=256):
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, args=(path,), name="task-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, operation, *args):
+        """Run add/update/remove on the writer thread; returns its result or raises its error"""
+        future = Future()
+        self._queue.put((operation, args, future))
+        return future.result(timeout=WRITE_TIMEOUT)
+
+    def _run(self, path):
+        store = TaskStore(path, legacy_file=None)
+        operations = {"add": store._add, "update": store._update, "remove": store._remove}
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            results = []
+            try:
+                with store.db:
+                    for operation, args, future in batch:
+                        try:
+                            results.append((future, operations[operation](*args), None))
+                        except sqlite3.Error:
+                            raise  # roll back the whole batch
+                        except Exception as e:
+                            # Fails before writing anything (conflict, bad value), the rest of the batch goes on
+                            results.append((future, None, e))
+            except Exception as e:
+                # Nothing in the batch was committed; the thread itself must keep running
+                for _, _, future in batch:
+                    future.set_exception(e)
+                continue
+            # Only answer once the batch is committed and visible to readers
+            for future, result, error in results:
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+
+class TodoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so clients do not reconnect per request
+    # Headers and body go out as two small writes; with Nagle on, the body
+    # waits for the client's delayed ACK (~40 ms) on every kept-alive request
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, data, headers=None):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_task(self, status, task, headers=None):
+        headers = dict(headers or {}, ETag=f'"{task.version}"')
+        self.send_json(status, task.as_dict(), headers)
+
+    def route(self):
+        """(path parts after /tasks, query) or None if the path is not under /tasks"""
+        url = urlparse(self.path)
+        parts = url.path.strip("/").split("/")
+        if parts[0] != "tasks":
+            return None
+        return parts[1:], parse_qs(url.query)
+
+    def task_id(self, parts):
+        """Task ID from the path, None if it is not /tasks/<number>; ValueError if out of range"""
+        if len(parts) == 1 and parts[0].isdigit():
+            return check_id(int(parts[0]), "Task ID")
+        return None
+
+    def reject(self, status, message):
+        """Error answer before the request body was read, so the connection cannot be reused"""
+        self.send_json(status, {"error": message}, {"Connection": "close"})
+
+    def expected_version(self):
+        """Version from If-Match ("3" or '"3"'), None when absent or *"""
+        value = self.headers.get("If-Match", "").strip().strip('"')
+        if not value or value == "*":
+            return None
+        if not value.isdigit():
+            raise ValueError("If-Match must be a task version")
+        return check_id(int(value), "If-Match")
+
+    def read_text(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            data = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            raise ValueError("Body must be JSON") from None
+        if not isinstance(data, dict):
+            raise ValueError('Body must be a JSON object like {"text": "..."}')
+        task = parse_task(str(data.get("text", "")))
+        if not task.text:
+            raise ValueError("Task cannot be empty!")
+        return task
+
+    def do_GET(self):
+        route = self.route()
+        if route is None:
+            return self.send_json(404, {"error": "Not found"})
+        parts, query = route
+        store = self.server.reader()
+        if not parts:
+            try:
+                after_id = check_id(int(query.get("after", ["0"])[0]), "after")
+                limit = max(1, min(100, int(query.get("limit", [PAGE_SIZE])[0])))
+            except ValueError as e:
+                message = str(e) if "too large" in str(e) else "after and limit must be numbers"
+                return self.send_json(400, {"error": message})
+            if "q" in query:
+                tasks = store.search(query["q"][0], after_id, limit)
+            else:
+                tasks = store.page(after_id, limit)
+            return self.send_json(200, {
+                "tasks": [task.as_dict() for task in tasks],
+                "next_after": tasks[-1].id if len(tasks) == limit else None,
+            })
+        if parts == ["next"]:
+            today = date.today()
+            return self.send_json(200, {
+                "overdue": [task.as_dict() for task in store.overdue(today)],
+                "due_next": [task.as_dict() for task in store.next_due(today)],
+                "top_priority": [task.as_dict() for task in store.top_priority()],
+            })
+        try:
+            task_id = self.task_id(parts)
+        except ValueError as e:
+            return self.send_json(400, {"error": str(e)})
+        task = store.get(task_id) if task_id is not None else None
+        if task is None:
+            return self.send_json(404, {"error": "No such task"})
+        self.send_task(200, task)
+
+    def do_POST(self):
+        route = self.route()
+        if route is None or route[0]:
+            return self.reject(404, "Not found")
+        try:
+            task = self.read_text()
+        except ValueError as e:
+            return self.send_json(400, {"error": str(e)})
+        try:
+            task.id = self.server.writer.submit("add", task)
+        except Exception as e:
+            return self.write_failed(e)
+        task.version = 1
+        self.send_task(201, task, {"Location": f"/tasks/{task.id}"})
+
+    def change(self, operation):
+        """PUT and DELETE: both take If-Match and answer with the task"""
+        route = self.route()
+        try:
+            task_id = self.task_id(route[0]) if route else None
+        except ValueError as e:
+            return self.reject(400, str(e))
+        if task_id is None:
+            return self.reject(404, "Not found")
+        try:
+            args = (task_id, self.read_text()) if operation == "update" else (task_id,)
+            task = self.server.writer.submit(operation, *args, self.expected_version())
+        except ValueError as e:
+            return self.send_json(400, {"error": str(e)})
+        except VersionConflict as e:
+            # Send the current task so the client can merge and retry
+            return self.send_json(412, {"error": str(e), "current": e.current.as_dict()},
+                                  {"ETag": f'"{e.current.version}"'})
+        except Exception as e:
+            return self.write_failed(e)
+        if task is None:
+            return self.send_json(404, {"error": "No such task"})
+        self.send_task(200, task)
+
+    def write_failed(self, error):
+        if isinstance(error, TimeoutError):
+            return self.send_json(503, {"error": "The server is busy, try again"})
+        return self.send_json(500, {"error": f"Could not save: {error}"})
+
+    def do_PUT(self):
+        self.change("update")
+
+    def do_DELETE(self):
+        self.change("remove")
+
+
+class TodoServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # listen backlog; the default of 5 resets connections under load
+
+    def __init__(self, address, path=DB_FILE):
+        TaskStore(path).close()  # create or upgrade the database before the threads open it
+        self.path = path
+        self.writer = TaskWriter(path)
+        self._local = threading.local()
+        super().__init__(address, TodoHandler)
+
+    def reader(self):
+        """This thread's own read connection"""
+        store = getattr(self._local, "store", None)
+        if store is None:
+            store = self._local.store = TaskStore(self.path, legacy_file=None)
+        return store
+
+
+def serve(host="127.0.0.1", port=8765, path=DB_FILE):
+    server = TodoServer((host, port), path)
+    print(f"To-do server on http://{host}:{server.server_port}/tasks (database: {path})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Goodbye!")
+    finally:
+        server.server_close()
 
 # Run the program
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Simple To-Do List")
+    parser.add_argument("--serve", action="store_true", help="run the shared JSON API instead of the menu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--db", default=DB_FILE, help="task database (default: tasks.db or $TODO_DB)")
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.host, args.port, args.db)
+    else:
+        main(args.db)
@@ -0,0 +1,242 @@
+"""
+Load test for the shared to-do server (todo.py --serve)
+
+Many keep-alive clients add, read, search, edit and remove tasks at the
+same time and the script prints ops/sec and p50/p99 latency per
+operation. Edits go to a small set of shared tasks with If-Match, so
+some of them run into another client's change (412) and retry, like
+real users would.
+
+Examples:
+    # start a server on a fresh database and test it
+    python todo_loadtest.py --clients 100 --duration 10
+
+    # against a server that is already running
+    python todo_loadtest.py --url http://127.0.0.1:8765
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import quote, urlparse
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'todo.py')
+
+WORDS = 'buy milk walk dog call mom fix bug write report review email boss pay rent book flight'.split()
+
+# Operation mix, as weights
+OPERATIONS = {'add': 25, 'page': 20, 'search': 20, 'get': 10, 'edit': 15, 'remove': 7, 'next': 3}
+MAX_RETRIES = 5
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def wait_for_port(host, port, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def random_task(rng):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(2, 5))]
+    if rng.random() < 0.3:
+        words.append(f"!{rng.randint(1, 9)}")
+    if rng.random() < 0.3:
+        words.append(f"due:2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+    return ' '.join(words)
+
+
+class Client:
+    """One user on one keep-alive connection"""
+
+    def __init__(self, host, port, shared_ids, seed):
+        self.host, self.port = host, port
+        self.conn = None
+        self.rng = random.Random(seed)
+        self.shared_ids = shared_ids
+        self.own_ids = []
+        self.versions = {}  # last version seen per shared task, may be stale
+        self.conflicts = 0  # 412 answers to edits (each one is retried)
+        self.gave_up = 0  # edits still conflicting after MAX_RETRIES
+
+    def request(self, method, path, body=None, headers=None):
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=10)
+        headers = dict(headers or {})
+        if body is not None:
+            body = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        try:
+            self.conn.request(method, path, body=body, headers=headers)
+            response = self.conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            self.conn = None
+            raise
+        return response.status, json.loads(data) if data else None
+
+    def run_operation(self, name):
+        """Do one operation; returns False if the server answered with an error"""
+        rng = self.rng
+        if name == 'remove' and not self.own_ids:
+            name = 'add'
+        if name == 'add':
+            status, data = self.request('POST', '/tasks', {'text': random_task(rng)})
+            if status == 201:
+                self.own_ids.append(data['id'])
+            return status == 201
+        if name == 'page':
+            status, _ = self.request('GET', f'/tasks?after={rng.randint(0, 1000)}&limit=20')
+            return status == 200
+        if name == 'search':
+            query = quote(f"{rng.choice(WORDS)} {rng.choice(WORDS)[:2]}")
+            status, _ = self.request('GET', f'/tasks?q={query}')
+            return status == 200
+        if name == 'get':
+            status, _ = self.request('GET', f'/tasks/{rng.choice(self.shared_ids)}')
+            return status == 200
+        if name == 'next':
+            status, _ = self.request('GET', '/tasks/next')
+            return status == 200
+        if name == 'remove':
+            task_id = self.own_ids.pop(rng.randrange(len(self.own_ids)))
+            status, _ = self.request('DELETE', f'/tasks/{task_id}')
+            return status == 200
+        # edit: read-modify-write on a shared task, retrying on conflicts
+        task_id = rng.choice(self.shared_ids)
+        for _ in range(MAX_RETRIES):
+            if task_id not in self.versions:
+                status, data = self.request('GET', f'/tasks/{task_id}')
+                if status != 200:
+                    return False
+                self.versions[task_id] = data['version']
+            status, data = self.request('PUT', f'/tasks/{task_id}', {'text': random_task(rng)},
+                                        {'If-Match': str(self.versions[task_id])})
+            if status == 200:
+                self.versions[task_id] = data['version']
+                return True
+            if status != 412:
+                return False
+            self.conflicts += 1
+            self.versions[task_id] = data['current']['version']
+        self.gave_up += 1
+        return True
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+
+def client_worker(client, deadline, latencies, counters, lock):
+    names = list(OPERATIONS)
+    weights = list(OPERATIONS.values())
+    while time.perf_counter() < deadline:
+        name = client.rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            ok = client.run_operation(name)
+        except (OSError, http.client.HTTPException):
+            ok = False
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.setdefault(name, []).append(elapsed)
+            if not ok:
+                counters['errors'] += 1
+    client.close()
+    with lock:
+        counters['conflicts'] += client.conflicts
+        counters['gave_up'] += client.gave_up
+
+
+def run_load(host, port, clients, duration, shared=50):
+    setup = Client(host, port, [], 0)
+    shared_ids = [setup.request('POST', '/tasks', {'text': f'shared task {i} !5'})[1]['id'] for i in range(shared)]
+    setup.close()
+
+    latencies = {}
+    counters = {'errors': 0, 'conflicts': 0, 'gave_up': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=client_worker,
+                         args=(Client(host, port, shared_ids, seed), deadline, latencies, counters, lock))
+        for seed in range(1, clients + 1)
+    ]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, counters, time.perf_counter() - started
+
+
+def print_results(latencies, counters, elapsed, clients):
+    everything = sorted(value for values in latencies.values() for value in values)
+    print(f"\n=== {clients} clients, {elapsed:.1f}s ===")
+    print(f"{'operation':<12}{'count':>10}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name in OPERATIONS:
+        values = sorted(latencies.get(name, []))
+        print(f"{name:<12}{len(values):>10}{len(values) / elapsed:>10.1f}"
+              f"{percentile(values, 50) * 1000:>10.2f}{percentile(values, 99) * 1000:>10.2f}")
+    print(f"{'total':<12}{len(everything):>10}{len(everything) / elapsed:>10.1f}"
+          f"{percentile(everything, 50) * 1000:>10.2f}{percentile(everything, 99) * 1000:>10.2f}")
+    print(f"errors: {counters['errors']}, edit conflicts (412, retried): {counters['conflicts']}, "
+          f"edits given up after {MAX_RETRIES} tries: {counters['gave_up']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the shared to-do server")
+    parser.add_argument('--url', help="server to test (default: start one on a temporary database)")
+    parser.add_argument('--clients', type=int, default=100, help="concurrent clients")
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds to run")
+    args = parser.parse_args()
+
+    if args.url:
+        url = urlparse(args.url)
+        latencies, counters, elapsed = run_load(url.hostname, url.port or 80, args.clients, args.duration)
+        print_results(latencies, counters, elapsed, args.clients)
+        return
+
+    port = free_port()
+    with tempfile.TemporaryDirectory() as workdir:
+        server = subprocess.Popen(
+            [sys.executable, APP_FILE, '--serve', '--port', str(port), '--db', os.path.join(workdir, 'tasks.db')],
+            cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            if not wait_for_port('127.0.0.1', port):
+                print("Server did not start")
+                return
+            latencies, counters, elapsed = run_load('127.0.0.1', port, args.clients, args.duration)
+            print_results(latencies, counters, elapsed, args.clients)
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+if __name__ == '__main__':
+    main()